@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import timedelta
 from pydantic import AnyHttpUrl, Field
 from pydantic_settings import BaseSettings
-from typing import Dict
+from typing import Dict, Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -13,6 +14,8 @@ class Settings(BaseSettings):
     """
 
     app_name: str = "NLP Portfolio API"
+    # Development mode: strict template rendering and template auto-reload
+    debug: bool = False
 
     # Networking and timeouts
     http_timeout_seconds: int = 10
@@ -29,12 +32,90 @@ class Settings(BaseSettings):
         }
     )
 
+    # HuggingFace inference: "auto" picks CUDA when available, else "cpu"
+    hf_device: str = "auto"
+    # Batch size used by the HuggingFace pipelines when given a list of inputs
+    hf_batch_size: int = 8
+    # Pad batched sequences to a multiple of this (tensor-core friendly shapes);
+    # unset picks 16 on CUDA (fp16) and 8 on CPU, 1 disables rounding
+    round_to: Optional[int] = None
+    # Dynamic batching of concurrent /analyze requests: flush at this many
+    # queued inputs or after this many milliseconds, whichever comes first
+    batch_max_size: int = 16
+    batch_max_wait_ms: int = 10
+    # Cache of /analyze results keyed by task and input digest
+    infer_cache_size: int = 10_000
+    infer_cache_ttl_seconds: int = 3600
+    # Comma-separated tasks (e.g. "ner,emotion") whose models are warmed in the
+    # background at startup; everything else still loads on its first request
+    preload_tasks: str = ""
+    # How long /healthz waits for that warm-up before answering 503
+    healthz_wait_seconds: float = 5.0
+    # Threads running model calls; torch's intra-op threads are divided
+    # between them so concurrent forward passes don't oversubscribe the CPU
+    inference_workers: int = 2
+    # Dynamically quantize the torch emotion, QA and summarization models to
+    # int8 on CPU: about half the latency and weight RAM, at a small accuracy cost
+    hf_quantize_int8: bool = False
+    # Directory holding int8 ONNX exports (see export_onnx.py); used on CPU when present
+    onnx_model_dir: str = "app/models/onnx"
+    # Summarization backend: "t5" (t5-small), "t5-int8" (dynamically quantized
+    # t5-small, CPU only) or "lexrank" (extractive, needs sumy and NLTK punkt,
+    # no transformers)
+    summarizer_backend: Literal["t5", "t5-int8", "lexrank"] = "t5"
+
     # Cache TTL for feed results (seconds)
     rss_cache_ttl_seconds: int = 600  # 10 minutes
+    # How long a failed feed download is served as empty before retrying
+    feed_failure_ttl_seconds: int = 30
+    # Maximum article pages downloaded at once when full_text=True
+    article_fetch_concurrency: int = 8
+    # Fetch all feeds in the background at startup so first requests hit the cache
+    prefetch_feeds_on_startup: bool = True
 
     @property
     def rss_cache_ttl(self) -> timedelta:
         return timedelta(seconds=self.rss_cache_ttl_seconds)
 
 
-settings = Settings()
+@dataclass(frozen=True, slots=True)
+class RuntimeConfig:
+    """Immutable snapshot of :class:`Settings` used at runtime.
+
+    Settings are validated once at import; request handlers then read plain
+    slot attributes instead of going through pydantic on every access. Fields
+    mirror :class:`Settings`, plus the precomputed ``rss_cache_ttl``.
+    """
+
+    app_name: str
+    debug: bool
+    http_timeout_seconds: int
+    http_user_agent: str
+    abc_feeds: Dict[str, str]
+    hf_device: str
+    hf_batch_size: int
+    round_to: Optional[int]
+    batch_max_size: int
+    batch_max_wait_ms: int
+    infer_cache_size: int
+    infer_cache_ttl_seconds: int
+    preload_tasks: str
+    healthz_wait_seconds: float
+    inference_workers: int
+    hf_quantize_int8: bool
+    onnx_model_dir: str
+    summarizer_backend: Literal["t5", "t5-int8", "lexrank"]
+    rss_cache_ttl_seconds: int
+    feed_failure_ttl_seconds: int
+    rss_cache_ttl: timedelta
+    article_fetch_concurrency: int
+    prefetch_feeds_on_startup: bool
+
+    @classmethod
+    def from_settings(cls, source: Settings) -> "RuntimeConfig":
+        values = source.model_dump(mode="python")
+        values["abc_feeds"] = {name: str(url) for name, url in source.abc_feeds.items()}
+        return cls(**values, rss_cache_ttl=source.rss_cache_ttl)
+
+
+settings = RuntimeConfig.from_settings(Settings())
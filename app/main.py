@@ -1,20 +1,64 @@
-from fastapi import FastAPI, Request
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 
 from app.config import settings
+from app.models.summarize import check_backend as check_summarizer_backend
 from app.routers import nlp
 from app.routers import news as news_router
 from app.routers import home as home_router
+from app.services.batcher import stop_batchers
+from app.services.inference import preload_tasks
+from app.services.news_feed import close_http_client, start_feed_refresh, start_http_client
+
+# Routers only reference the lazy strategy registry, so importing them does
+# not load any model; each one is built on its first request.
+ROUTERS = (home_router.router, nlp.router, news_router.router)
+
+logger = logging.getLogger(__name__)
+
+
+async def _warm_up(ready: asyncio.Event) -> None:
+    """Preload models, then mark the app ready even if a preload failed.
+
+    A failed preload is retried lazily by the first request for that task.
+    """
+    try:
+        await preload_tasks()
+    except Exception:
+        logger.exception("Model preload failed; models will load on first use")
+    finally:
+        ready.set()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    check_summarizer_backend()
+    await start_http_client()
+    await start_feed_refresh()
+    # Models warm in the background so the server starts accepting
+    # connections at once; /healthz waits on this event for readiness
+    app.state.ready = asyncio.Event()
+    warmup = asyncio.create_task(_warm_up(app.state.ready))
+    try:
+        yield
+    finally:
+        warmup.cancel()
+        await close_http_client()
+        await stop_batchers()
+
 
-app = FastAPI(title=settings.app_name)
+app = FastAPI(title=settings.app_name, default_response_class=ORJSONResponse, lifespan=lifespan)
 
-app.include_router(home_router.router)
-app.include_router(nlp.router)
-app.include_router(news_router.router)
+for router in ROUTERS:
+    app.include_router(router)
 
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
-templates = Jinja2Templates(directory="app/templates")
+app.mount("/static", StaticFiles(directory="app/static", check_dir=False), name="static")
 
 # terminate server with: taskkill /F /IM uvicorn.exe
 # reload server with uvicorn app.main:app --reload
+# production: uvicorn app.main:app --workers 4 --loop uvloop --http httptools
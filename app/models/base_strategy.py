@@ -1,6 +1,11 @@
 from abc import ABC, abstractmethod
+from typing import List
 
 class NLPStrategy(ABC):
     @abstractmethod
     def analyze(self, **kwargs):
-        pass
\ No newline at end of file
+        pass
+
+    def analyze_batch(self, texts: List[str], **kwargs) -> List:
+        """Analyze several texts; strategies backed by batched models override this."""
+        return [self.analyze(text=text, **kwargs) for text in texts]
@@ -1,8 +1,30 @@
+from typing import List
 from transformers import pipeline
 from .base_strategy import NLPStrategy
+from .batching import run_length_sorted, token_lengths
+from .lazy import load_once
+from app.config import settings
+from .loader import model_kwargs, padding_kwargs, quantize_int8
 
-emotion_pipeline = pipeline("text-classification", model="bhadresh-savani/distilbert-base-uncased-emotion", return_all_scores=False)
+
+@load_once
+def get_emotion_pipeline():
+    pipe = pipeline(
+        "text-classification",
+        return_all_scores=False,
+        **model_kwargs(
+            "emotion",
+            "bhadresh-savani/distilbert-base-uncased-emotion",
+            "ORTModelForSequenceClassification",
+        ),
+    )
+    return quantize_int8(pipe, "emotion") if settings.hf_quantize_int8 else pipe
 
 class EmotionStrategy(NLPStrategy):
     def analyze(self, text: str, **kwargs):
-        return emotion_pipeline(text)[0]
\ No newline at end of file
+        return get_emotion_pipeline()(text)[0]
+
+    def analyze_batch(self, texts: List[str], **kwargs):
+        pipe = get_emotion_pipeline()
+        lengths = token_lengths(pipe.tokenizer, texts)
+        return run_length_sorted(pipe, texts, lengths, **padding_kwargs())
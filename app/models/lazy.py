@@ -0,0 +1,28 @@
+"""Load-once helper for model singletons."""
+
+from __future__ import annotations
+
+import functools
+import threading
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def load_once(func: Callable[[], T]) -> Callable[[], T]:
+    """Cache a zero-argument loader, running it at most once.
+
+    ``functools.lru_cache`` alone lets two threads that miss at the same time
+    both run the loader, which for a model means loading it twice. Loaders
+    are called from the inference pool, so the first call holds a lock.
+    """
+    cached = functools.lru_cache(maxsize=1)(func)
+    lock = threading.Lock()
+
+    @functools.wraps(func)
+    def wrapper() -> T:
+        with lock:
+            return cached()
+
+    wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+    return wrapper
@@ -0,0 +1,117 @@
+"""Helpers for building HuggingFace pipelines on the configured device."""
+
+from __future__ import annotations
+
+import logging
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import torch
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# File name ORTQuantizer writes for a dynamically quantized model
+ONNX_FILE = "model_quantized.onnx"
+
+
+def resolve_device() -> str:
+    """Map the ``hf_device`` setting to a concrete torch device string."""
+    if settings.hf_device == "auto":
+        return "cuda:0" if torch.cuda.is_available() else "cpu"
+    return settings.hf_device
+
+
+@lru_cache(maxsize=1)
+def limit_torch_threads() -> int:
+    """Split the cores between the inference workers; returns threads per call.
+
+    Without this every concurrent forward pass starts ``cpu_count`` intra-op
+    threads, so N workers run roughly N * cpu_count threads on cpu_count cores.
+    """
+    threads = max(1, (os.cpu_count() or 1) // settings.inference_workers)
+    torch.set_num_threads(threads)
+    return threads
+
+
+def pipeline_kwargs() -> Dict[str, Any]:
+    """Keyword arguments shared by every ``transformers.pipeline`` call.
+
+    On CUDA the weights are loaded in fp16 straight onto the GPU, skipping the
+    fp32 copy in host RAM. CPU keeps fp32, which is faster there than fp16.
+    """
+    limit_torch_threads()
+    device = resolve_device()
+    kwargs: Dict[str, Any] = {"device": device, "batch_size": settings.hf_batch_size}
+    if device.startswith("cuda"):
+        kwargs["torch_dtype"] = torch.float16
+        kwargs["model_kwargs"] = {"low_cpu_mem_usage": True}
+    return kwargs
+
+
+def padding_kwargs() -> Dict[str, Any]:
+    """Tokenizer kwargs padding each sequence up to a multiple of ``round_to``.
+
+    Every item is rounded before the pipeline pads a minibatch to its longest
+    member, so the batch length is a multiple too and GEMMs get aligned shapes.
+    """
+    round_to = settings.round_to
+    if round_to is None:
+        round_to = 16 if resolve_device().startswith("cuda") else 8
+    if round_to <= 1:
+        return {}
+    return {"padding": "longest", "pad_to_multiple_of": round_to}
+
+
+def quantize_int8(pipe: Any, name: str) -> Any:
+    """Swap the pipeline model's ``nn.Linear`` layers for dynamic int8 ones.
+
+    Only applies on CPU, where fbgemm/oneDNN int8 kernels roughly halve both
+    latency and weight memory. CUDA keeps its fp16 weights, and an ONNX
+    Runtime model is already quantized at export, so both are left as is.
+    """
+    if not isinstance(pipe.model, torch.nn.Module):
+        return pipe
+    device = resolve_device()
+    if device != "cpu":
+        logger.warning("int8 quantization is CPU only; using the fp16 %s model on %s", name, device)
+        return pipe
+    pipe.model = torch.quantization.quantize_dynamic(pipe.model, {torch.nn.Linear}, dtype=torch.qint8)
+    return pipe
+
+
+def _onnx_model(name: str, ort_class: str) -> Optional[Dict[str, Any]]:
+    """Load the int8 ONNX export for ``name`` if one exists and can be used.
+
+    ONNX Runtime is only used on CPU; ``optimum`` is an optional dependency, so
+    a missing install falls back to the regular torch model.
+    """
+    path = Path(settings.onnx_model_dir) / name
+    if resolve_device() != "cpu" or not (path / ONNX_FILE).exists():
+        return None
+    try:
+        from optimum import onnxruntime as ort
+    except ImportError:
+        logger.warning("ONNX export found at %s but optimum is not installed", path)
+        return None
+    from transformers import AutoTokenizer
+
+    model = getattr(ort, ort_class).from_pretrained(
+        path, file_name=ONNX_FILE, provider="CPUExecutionProvider"
+    )
+    return {"model": model, "tokenizer": AutoTokenizer.from_pretrained(path)}
+
+
+def model_kwargs(name: str, model_id: str, ort_class: str, **hub_kwargs: Any) -> Dict[str, Any]:
+    """Pipeline kwargs for ``model_id``, preferring its quantized ONNX export.
+
+    ``hub_kwargs`` (e.g. ``revision``) only apply when loading from the hub.
+    """
+    onnx = _onnx_model(name, ort_class)
+    if onnx is not None:
+        logger.info("Using quantized ONNX model for %s", name)
+        return {**onnx, "batch_size": settings.hf_batch_size}
+    return {"model": model_id, **hub_kwargs, **pipeline_kwargs()}
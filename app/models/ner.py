@@ -1,9 +1,23 @@
+from typing import List
 import spacy
 from .base_strategy import NLPStrategy
+from .lazy import load_once
 
-nlp_model = spacy.load("en_core_web_sm")
+# Only doc.ents is read, and the NER component depends on tok2vec alone
+DISABLED_COMPONENTS = ["parser", "tagger", "lemmatizer", "attribute_ruler"]
+
+
+@load_once
+def get_nlp_model():
+    return spacy.load("en_core_web_sm", disable=DISABLED_COMPONENTS)
+
+def _entities(doc):
+    return [{"text": ent.text, "label": ent.label_} for ent in doc.ents]
 
 class NERStrategy(NLPStrategy):
     def analyze(self, text: str, **kwargs):
-        doc = nlp_model(text)
-        return [{"text": ent.text, "label": ent.label_} for ent in doc.ents]
\ No newline at end of file
+        return _entities(get_nlp_model()(text))
+
+    def analyze_batch(self, texts: List[str], **kwargs):
+        docs = get_nlp_model().pipe(texts, batch_size=32, n_process=1)
+        return [_entities(doc) for doc in docs]
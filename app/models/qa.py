@@ -1,18 +1,39 @@
+from typing import List
 from transformers import pipeline
 from .base_strategy import NLPStrategy
+from .batching import run_length_sorted, token_lengths
+from .lazy import load_once
+from app.config import settings
+from .loader import model_kwargs, quantize_int8
 import logging
 
 logger = logging.getLogger(__name__)
 
-qa_pipeline = pipeline(
-    "question-answering",
-    model="distilbert/distilbert-base-cased-distilled-squad",
-    revision="main"
-)
+
+@load_once
+def get_qa_pipeline():
+    pipe = pipeline(
+        "question-answering",
+        **model_kwargs(
+            "qa",
+            "distilbert/distilbert-base-cased-distilled-squad",
+            "ORTModelForQuestionAnswering",
+            revision="main",
+        ),
+    )
+    return quantize_int8(pipe, "qa") if settings.hf_quantize_int8 else pipe
 
 class QAStrategy(NLPStrategy):
     def analyze(self, text: str, context: str, **kwargs):
-        result = qa_pipeline(question=text, context=context)
+        result = get_qa_pipeline()(question=text, context=context)
         logger.info(f"QA input: question={text}, context={context}")
         logger.info(f"QA result: {result}")
-        return {"answer": result.get("answer", ""), "score": result.get("score", 0.0)}
\ No newline at end of file
+        return {"answer": result.get("answer", ""), "score": result.get("score", 0.0)}
+
+    def analyze_batch(self, texts: List[str], contexts: List[str], **kwargs):
+        inputs = [{"question": q, "context": c} for q, c in zip(texts, contexts)]
+        pipe = get_qa_pipeline()
+        # Contexts dominate the encoded length, so sort on those
+        results = run_length_sorted(pipe, inputs, token_lengths(pipe.tokenizer, contexts))
+        logger.info(f"QA batch of {len(inputs)} questions")
+        return [{"answer": r.get("answer", ""), "score": r.get("score", 0.0)} for r in results]
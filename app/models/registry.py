@@ -0,0 +1,48 @@
+"""Single registry of NLP strategies shared by every router."""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Mapping
+from typing import Dict, Iterator, Tuple
+
+from .base_strategy import NLPStrategy
+
+# Strategy modules are imported on first use so that serving one task never
+# loads the models behind the others
+STRATEGY_CLASSES: Dict[str, Tuple[str, str]] = {
+    "sentiment": ("app.models.sentiment", "SentimentStrategy"),
+    "ner": ("app.models.ner", "NERStrategy"),
+    "summarize": ("app.models.summarize", "SummarizationStrategy"),
+    "emotion": ("app.models.emotion", "EmotionStrategy"),
+    "qa": ("app.models.qa", "QAStrategy"),
+}
+
+
+class LazyStrategies(Mapping):
+    """Read-only mapping of task name to strategy, built on first lookup."""
+
+    def __init__(self, classes: Dict[str, Tuple[str, str]]) -> None:
+        self._classes = classes
+        self._instances: Dict[str, NLPStrategy] = {}
+
+    def __getitem__(self, name: str) -> NLPStrategy:
+        strategy = self._instances.get(name)
+        if strategy is None:
+            module_name, class_name = self._classes[name]
+            strategy = getattr(importlib.import_module(module_name), class_name)()
+            self._instances[name] = strategy
+        return strategy
+
+    def __contains__(self, name: object) -> bool:
+        # Membership must not trigger an import
+        return name in self._classes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._classes)
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+
+STRATEGIES = LazyStrategies(STRATEGY_CLASSES)
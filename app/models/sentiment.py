@@ -1,19 +1,22 @@
-from textblob import TextBlob
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 from .base_strategy import NLPStrategy
 
+# VADER's lexicon and regexes are compiled once here rather than per request
+_analyzer = SentimentIntensityAnalyzer()
+
+# Polarity beyond +/-THRESHOLD is positive/negative, anything between is neutral
+THRESHOLD = 0.1
+LABELS = ("negative", "neutral", "positive")
+
 class SentimentStrategy(NLPStrategy):
     def analyze(self, text: str, **kwargs):
-        blob = TextBlob(text)
-        polarity = blob.sentiment.polarity
-        subjectivity = blob.sentiment.subjectivity
-        if polarity > 0.1:
-            label = "positive"
-        elif polarity < -0.1:
-            label = "negative"
-        else:
-            label = "neutral"
+        scores = _analyzer.polarity_scores(text)
+        # compound is already normalised to [-1, 1]; the share of polar tokens
+        # stands in for TextBlob's subjectivity (0.0 for empty text)
+        polarity = float(scores["compound"])
+        subjectivity = float(scores["pos"] + scores["neg"])
         return {
-            "sentiment": label,
+            "sentiment": LABELS[(polarity > THRESHOLD) - (polarity < -THRESHOLD) + 1],
             "polarity": polarity,
             "subjectivity": subjectivity
-        }
\ No newline at end of file
+        }
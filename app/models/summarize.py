@@ -1,9 +1,100 @@
-from transformers import pipeline
+import logging
+from typing import List
+from app.config import settings
 from .base_strategy import NLPStrategy
+from .batching import run_length_sorted, token_lengths
+from .lazy import load_once
 
-summarizer = pipeline("summarization", model="t5-small")
+logger = logging.getLogger(__name__)
+
+GENERATION_KWARGS = {"max_length": 60, "min_length": 10, "do_sample": False}
+# Number of sentences the extractive (LexRank) backend keeps
+LEXRANK_SENTENCES = 3
+
+
+@load_once
+def get_summarizer():
+    # Imported here so the lexrank backend never loads torch/transformers
+    from transformers import pipeline
+    from .loader import pipeline_kwargs, quantize_int8
+
+    summarizer = pipeline("summarization", model="t5-small", **pipeline_kwargs())
+    if settings.summarizer_backend == "t5-int8" or settings.hf_quantize_int8:
+        summarizer = quantize_int8(summarizer, "summarize")
+    return summarizer
+
+@load_once
+def get_lexrank():
+    from sumy.nlp.tokenizers import Tokenizer
+    from sumy.summarizers.lex_rank import LexRankSummarizer
+
+    return Tokenizer("english"), LexRankSummarizer()
+
+def _lexrank_summary(text: str) -> str:
+    from sumy.parsers.plaintext import PlaintextParser
+
+    tokenizer, summarizer = get_lexrank()
+    document = PlaintextParser.from_string(text, tokenizer).document
+    return " ".join(str(s) for s in summarizer(document, LEXRANK_SENTENCES))
+
+def check_backend() -> None:
+    """Fail at startup if the configured backend's optional dependencies are missing.
+
+    Called from the app lifespan so a misconfigured lexrank deployment
+    refuses to start instead of returning 500 on every summarize request.
+    """
+    if settings.summarizer_backend != "lexrank":
+        return
+    try:
+        tokenizer, _ = get_lexrank()
+        tokenizer.to_sentences("Startup check. Two sentences.")
+    except (ImportError, LookupError) as exc:
+        raise RuntimeError(
+            "summarizer_backend=lexrank needs sumy and the NLTK punkt data: "
+            "pip install sumy && python -m nltk.downloader punkt punkt_tab"
+        ) from exc
+
+def _inference_mode():
+    """``torch.inference_mode()``, importing torch only on the t5 path.
+
+    Stricter than the pipeline's own ``no_grad``: it also skips the view and
+    version-counter tracking on every tensor generate creates.
+    """
+    import torch
+
+    return torch.inference_mode()
+
+def _require_text(text: str) -> None:
+    # Checked before the model is loaded, so blank input fails in microseconds
+    if not text or text.isspace():
+        raise ValueError("Text to summarize is empty")
 
 class SummarizationStrategy(NLPStrategy):
     def analyze(self, text: str, **kwargs):
-        summary = summarizer(text, max_length=60, min_length=10, do_sample=False)
-        return {"summary": summary[0]["summary_text"]}
\ No newline at end of file
+        _require_text(text)
+        if settings.summarizer_backend == "lexrank":
+            return {"summary": _lexrank_summary(text)}
+        summarizer = get_summarizer()
+        with _inference_mode():
+            summary = summarizer(text, **GENERATION_KWARGS)
+        return {"summary": summary[0]["summary_text"]}
+
+    def analyze_batch(self, texts: List[str], **kwargs):
+        # A blank item (e.g. a feed entry with no text) gets an empty summary
+        # rather than failing the whole batch; only the rest reach the model
+        results: List[dict] = [{"summary": ""} for _ in texts]
+        indices = [i for i, text in enumerate(texts) if text and not text.isspace()]
+        if not indices:
+            return results
+        inputs = [texts[i] for i in indices]
+        if settings.summarizer_backend == "lexrank":
+            summaries = [_lexrank_summary(text) for text in inputs]
+        else:
+            summarizer = get_summarizer()
+            lengths = token_lengths(summarizer.tokenizer, inputs)
+            with _inference_mode():
+                outputs = run_length_sorted(summarizer, inputs, lengths, **GENERATION_KWARGS)
+            summaries = [output["summary_text"] for output in outputs]
+        for i, summary in zip(indices, summaries):
+            results[i] = {"summary": summary}
+        return results
@@ -1,14 +1,32 @@
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse, ORJSONResponse
 
-router = APIRouter()
+from app.config import settings
+from app.templating import templates
 
-templates = Jinja2Templates(directory="app/templates")
+router = APIRouter()
 
 
 @router.get("/home", response_class=HTMLResponse)
 async def landing(request: Request):
     return templates.TemplateResponse("landing.html", {"request": request})
+
+
+@router.get("/healthz")
+async def healthz(request: Request):
+    """Readiness probe for deploy scripts; renders no template.
+
+    While the startup warm-up runs it waits up to ``healthz_wait_seconds``
+    for it to finish, then answers 503 so callers poll again.
+    """
+    ready = getattr(request.app.state, "ready", None)
+    if ready is not None and not ready.is_set():
+        try:
+            await asyncio.wait_for(ready.wait(), settings.healthz_wait_seconds)
+        except asyncio.TimeoutError:
+            return ORJSONResponse({"status": "starting"}, status_code=503)
+    return {"status": "ok"}
@@ -1,44 +1,120 @@
 from __future__ import annotations
 
-from typing import List
+import asyncio
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+from cachetools import TTLCache
 from fastapi import APIRouter, HTTPException, Query, Request
-from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 
-from app.services.news_feed import fetch_abc_feed
-from app.models.sentiment import SentimentStrategy
-from app.models.ner import NERStrategy
-from app.models.summarize import SummarizationStrategy
-from app.models.emotion import EmotionStrategy
-from app.models.qa import QAStrategy
+from app.config import settings
+from app.services.inference import run_inference
+from app.services.news_feed import afetch_abc_feed
+from app.models.registry import STRATEGIES, STRATEGY_CLASSES
+from app.templating import templates
 
 router = APIRouter(prefix="/news", tags=["news"])
 
-templates = Jinja2Templates(directory="app/templates")
 
+# Rendered /news and /news/browse bodies, keyed by route and query. Feeds only
+# change every rss_cache_ttl_seconds, so re-serialising them per hit is waste.
+_response_cache: TTLCache = TTLCache(maxsize=64, ttl=settings.rss_cache_ttl_seconds)
+
+
+def _wants_fresh(request: Request) -> bool:
+    """``Cache-Control: no-cache`` skips both the response and the feed cache."""
+    return "no-cache" in request.headers.get("cache-control", "")
+
+
+@router.get("/")
+async def get_news(request: Request, feed_name: str = Query("top_stories"), full_text: bool = Query(False)):
+    key = f"news:{feed_name}:{full_text}"
+    fresh = _wants_fresh(request)
+    if not fresh:
+        body = _response_cache.get(key)
+        if body is not None:
+            return Response(content=body, media_type="application/json")
 
-@router.get("/", response_class=JSONResponse)
-async def get_news(feed_name: str = Query("top_stories"), full_text: bool = Query(False)):
     try:
-        articles = fetch_abc_feed(feed_name=feed_name, full_text=full_text)
-        return {"status": "success", "count": len(articles), "articles": [a.__dict__ for a in articles]}
+        articles = await afetch_abc_feed(feed_name=feed_name, full_text=full_text, fresh=fresh)
+        response = ORJSONResponse({"status": "success", "count": len(articles), "articles": [a.to_dict() for a in articles]})
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve))
     except Exception as exc:  # pragma: no cover
         raise HTTPException(status_code=502, detail=f"Failed to fetch feed: {exc}")
 
+    if articles:
+        _response_cache[key] = response.body
+    return response
+
 
 @router.get("/browse", response_class=HTMLResponse)
 async def browse_news(request: Request, feed_name: str = Query("top_stories")):
+    key = f"browse:{feed_name}"
+    fresh = _wants_fresh(request)
+    if not fresh:
+        body = _response_cache.get(key)
+        if body is not None:
+            return HTMLResponse(content=body)
+
     try:
-        articles = fetch_abc_feed(feed_name=feed_name, full_text=False)
+        articles = await afetch_abc_feed(feed_name=feed_name, full_text=False, fresh=fresh)
     except Exception as exc:  # pragma: no cover
         articles = []
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         "news.html",
         {"request": request, "articles": articles, "feed_name": feed_name},
     )
 
+    if articles:
+        _response_cache[key] = response.body
+    return response
+
+
+DEFAULT_QA_QUESTION = "What is the main point of this article?"
+
+
+@lru_cache(maxsize=64)
+def parse_tools(tools: str) -> Tuple[str, ...]:
+    """Known tools named in ``tools``, de-duplicated in canonical order.
+
+    The query string only takes a handful of distinct values in practice, so
+    the parse is cached. Unknown names are dropped, and QA sorts last since it
+    is dispatched separately with its question.
+    """
+    requested = {t.strip() for t in tools.split(",")}
+    return tuple(name for name in STRATEGY_CLASSES if name in requested)
+
+
+async def _run_tools(texts: List[str], tool_list: Tuple[str, ...], question: str | None) -> List[Dict[str, Any]]:
+    """Run each requested tool once over all texts and return per-text outputs.
+
+    Every strategy receives the whole list so batched models do a single
+    forward pass per tool rather than one per article. Tools are independent,
+    so they run concurrently on the inference pool instead of blocking the loop.
+    """
+    names: List[str] = []
+    calls = []
+    for t in tool_list:
+        if t == "qa":
+            # Handle QA after the loop so we can provide a default/fallback question
+            continue
+        names.append(t)
+        calls.append(run_inference(STRATEGIES[t].analyze_batch, texts))
+
+    if "qa" in tool_list:
+        qa_question = (question or DEFAULT_QA_QUESTION).strip()
+        names.append("qa")
+        calls.append(
+            run_inference(STRATEGIES["qa"].analyze_batch, [qa_question] * len(texts), contexts=texts)
+        )
+
+    outputs: List[Dict[str, Any]] = [{} for _ in texts]
+    for name, results in zip(names, await asyncio.gather(*calls)):
+        for out, result in zip(outputs, results):
+            out[name] = result
+    return outputs
+
 
 @router.get("/analyze", response_class=HTMLResponse)
 async def analyze_article(
@@ -49,37 +125,14 @@ async def analyze_article(
     question: str | None = Query(None),
 ):
     try:
-        articles = fetch_abc_feed(feed_name=feed_name, full_text=True)
+        articles = await afetch_abc_feed(feed_name=feed_name, full_text=True)
         article = articles[index]
     except Exception as exc:
         raise HTTPException(status_code=400, detail=f"Invalid article selection: {exc}")
 
-    tool_list: List[str] = [t.strip() for t in tools.split(",") if t.strip()]
-    outputs = {}
-
-    # Build strategies lazily
-    strategies = {
-        "sentiment": SentimentStrategy(),
-        "ner": NERStrategy(),
-        "summarize": SummarizationStrategy(),
-        "emotion": EmotionStrategy(),
-        "qa": QAStrategy(),
-    }
-
+    tool_list = parse_tools(tools)
     text = article.full_text or article.summary
-
-    for t in tool_list:
-        if t == "qa":
-            # Handle QA after the loop so we can provide a default/fallback question
-            continue
-        strat = strategies.get(t)
-        if strat is None:
-            continue
-        outputs[t] = strat.analyze(text=text)
-
-    if "qa" in tool_list:
-        qa_question = (question or "What is the main point of this article?").strip()
-        outputs["qa"] = strategies["qa"].analyze(text=qa_question, context=text)
+    outputs = (await _run_tools([text], tool_list, question))[0]
 
     return templates.TemplateResponse(
         "news_result.html",
@@ -90,3 +143,40 @@ async def analyze_article(
             "outputs": outputs,
         },
     )
+
+
+@router.get("/analyze_batch")
+async def analyze_articles(
+    feed_name: str = Query("top_stories"),
+    indices: str = Query("0"),
+    tools: str = Query("sentiment"),
+    question: str | None = Query(None),
+):
+    """Analyze several articles of a feed in one request, batching each tool."""
+    try:
+        articles = await afetch_abc_feed(feed_name=feed_name, full_text=True)
+        selected = [int(i) for i in indices.split(",") if i.strip()]
+    except Exception as exc:
+        raise HTTPException(status_code=400, detail=f"Invalid article selection: {exc}")
+    if not selected:
+        raise HTTPException(status_code=400, detail="Invalid article selection: no indices given")
+    out_of_range = [i for i in selected if not 0 <= i < len(articles)]
+    if out_of_range:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid article selection: {out_of_range} not in 0..{len(articles) - 1}",
+        )
+    batch = [articles[i] for i in selected]
+
+    tool_list = parse_tools(tools)
+    texts = [a.full_text or a.summary for a in batch]
+    outputs = await _run_tools(texts, tool_list, question)
+
+    return {
+        "status": "success",
+        "count": len(batch),
+        "results": [
+            {"index": i, "title": a.title, "link": a.link, "outputs": out}
+            for i, a, out in zip(selected, batch, outputs)
+        ],
+    }
@@ -0,0 +1,125 @@
+"""Dynamic micro-batching for single-text ``/analyze/{task}`` requests.
+
+Requests for the same task that arrive within ``batch_max_wait_ms`` of each
+other (up to ``batch_max_size``) are run through one ``analyze_batch`` call,
+so concurrent users share a forward pass instead of queueing for one each.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, List, Optional, Tuple
+
+from app.config import settings
+from app.models.registry import STRATEGIES
+from app.services.inference import run_inference
+
+# Transformer/spaCy backed tasks; sentiment is a lexicon lookup with no batch
+# overhead to amortise, so it is called directly
+BATCHED_TASKS = ("ner", "summarize", "emotion", "qa")
+
+
+class DynamicBatcher:
+    """Collects requests for one task and runs them as a batch."""
+
+    def __init__(self, task: str, max_batch: int, max_wait_ms: int) -> None:
+        self.task = task
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def submit(self, text: str, context: str = "") -> Any:
+        """Queue one input and wait for its result from the next batch."""
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((text, context, future))
+        return await future
+
+    def _ensure_worker(self) -> None:
+        # The queue and worker belong to the loop that created them; rebuild
+        # them if called from a different loop (e.g. a fresh test client)
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def _collect(self) -> List[Tuple[str, str, asyncio.Future]]:
+        items = [await self._queue.get()]
+        deadline = self._loop.time() + self.max_wait
+        while len(items) < self.max_batch:
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+            try:
+                items.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return items
+
+    async def _analyze(self, items: List[Tuple[str, str, asyncio.Future]]) -> List[Any]:
+        strategy = STRATEGIES[self.task]
+        texts = [text for text, _, _ in items]
+        if self.task == "qa":
+            contexts = [context for _, context, _ in items]
+            return await run_inference(strategy.analyze_batch, texts, contexts=contexts)
+        return await run_inference(strategy.analyze_batch, texts)
+
+    async def _analyze_each(self, items: List[Tuple[str, str, asyncio.Future]]) -> None:
+        # One bad input shouldn't fail everyone it was batched with, so retry
+        # one at a time and only fail the requests that fail on their own
+        for text, context, future in items:
+            try:
+                result = await run_inference(
+                    STRATEGIES[self.task].analyze, text=text, context=context
+                )
+            except Exception as exc:
+                if not future.done():
+                    future.set_exception(exc)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+    async def _run(self) -> None:
+        while True:
+            items = await self._collect()
+            try:
+                results = await self._analyze(items)
+            except Exception:
+                await self._analyze_each(items)
+                continue
+            if len(results) != len(items):
+                error = RuntimeError(
+                    f"{self.task} returned {len(results)} results for {len(items)} inputs"
+                )
+                for _, _, future in items:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            for (_, _, future), result in zip(items, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def stop(self) -> None:
+        """Cancel the worker and fail anything still queued."""
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+        self._worker = None
+        while self._queue is not None and not self._queue.empty():
+            _, _, future = self._queue.get_nowait()
+            if not future.done():
+                future.cancel()
+
+
+BATCHERS = {
+    task: DynamicBatcher(task, settings.batch_max_size, settings.batch_max_wait_ms)
+    for task in BATCHED_TASKS
+}
+
+
+async def stop_batchers() -> None:
+    """Stop every batcher's worker. Called from the app lifespan on shutdown."""
+    for batcher in BATCHERS.values():
+        await batcher.stop()
@@ -0,0 +1,45 @@
+"""In-process cache of analysis results.
+
+Every task is deterministic for a given input, so repeated requests (demo
+examples, retries, the same story in several feeds) can skip the model.
+Keys hold fixed-size blake2b digests rather than the texts themselves, so
+long articles don't pin memory in the key table.
+
+The cache is only touched from the event loop and lookups never await, so
+no lock is needed. Cached results are shared between requests: treat them
+as read-only.
+"""
+
+from __future__ import annotations
+
+from hashlib import blake2b
+from typing import Any, Optional, Tuple
+
+from cachetools import TTLCache
+
+from app.config import settings
+
+_results: TTLCache = TTLCache(
+    maxsize=settings.infer_cache_size, ttl=settings.infer_cache_ttl_seconds
+)
+
+
+def _digest(value: str) -> bytes:
+    return blake2b(value.encode("utf-8"), digest_size=16).digest()
+
+
+def cache_key(task: str, text: str, context: str = "") -> Tuple[str, bytes, bytes]:
+    """Key for ``task`` on ``text``; context only matters for QA."""
+    return task, _digest(text), _digest(context if task == "qa" else "")
+
+
+def get_result(key: Tuple[str, bytes, bytes]) -> Optional[Any]:
+    return _results.get(key)
+
+
+def set_result(key: Tuple[str, bytes, bytes], result: Any) -> None:
+    _results[key] = result
+
+
+def clear() -> None:
+    _results.clear()
@@ -0,0 +1,64 @@
+"""Bounded thread pool for model inference.
+
+Inference is CPU-bound and torch/tokenizers release the GIL while they work,
+so running it on a dedicated pool keeps the event loop free to accept and
+render requests. Each torch forward pass is itself multi-threaded, so the
+pool stays small (``inference_workers``) and ``app.models.loader`` divides
+torch's intra-op threads between the workers.
+
+Pipelines and tokenizers are not safe to call from several threads at once,
+so calls on the same strategy are serialised; different models still run in
+parallel.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, DefaultDict, TypeVar
+
+from app.config import settings
+from app.models.registry import STRATEGIES
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+WARMUP_TEXT = "Warm-up sentence for model loading."
+
+_INFER_POOL = ThreadPoolExecutor(
+    max_workers=settings.inference_workers, thread_name_prefix="inference"
+)
+# One lock per strategy (or plain function); only touched from the event loop
+_model_locks: DefaultDict[Any, threading.Lock] = defaultdict(threading.Lock)
+
+
+def _call_locked(lock: threading.Lock, func: Callable[[], T]) -> T:
+    with lock:
+        return func()
+
+
+async def run_inference(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run ``func(*args, **kwargs)`` on the inference pool and await its result."""
+    lock = _model_locks[getattr(func, "__self__", func)]
+    call = functools.partial(func, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_INFER_POOL, _call_locked, lock, call)
+
+
+async def preload_tasks() -> None:
+    """Load and warm the models named in ``preload_tasks``. Run in the background on startup.
+
+    Each strategy runs one tiny input so weights, tokenizer and any lazy
+    graph setup are ready before the first real request.
+    """
+    for task in filter(None, (t.strip() for t in settings.preload_tasks.split(","))):
+        if task not in STRATEGIES:
+            logger.warning(f"Ignoring unknown preload task: {task}")
+            continue
+        await run_inference(STRATEGIES[task].analyze, text=WARMUP_TEXT, context=WARMUP_TEXT)
+        logger.info(f"Preloaded {task} model")
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
-import time
-from dataclasses import dataclass
-from typing import List, Optional
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import feedparser
+import httpx
 import requests
+from cachetools import LRUCache, TTLCache
 from newspaper import Article
 
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class NewsArticle:
@@ -18,29 +26,226 @@ class NewsArticle:
     published: str
     summary: str
     full_text: Optional[str] = None
+    _dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict view for JSON responses, built once per article."""
+        if self._dict is None:
+            self._dict = {
+                "title": self.title,
+                "link": self.link,
+                "published": self.published,
+                "summary": self.summary,
+                "full_text": self.full_text,
+            }
+        return self._dict
 
 
 class InMemoryCache:
-    """Very small in-process cache with TTL.
+    """Thread-safe TTL cache of parsed feeds, keyed by ``(feed_name, full_text)``.
+
+    The sync fetch may run in worker threads while the async one runs on the
+    event loop, and cachetools is not thread-safe, so every access takes a
+    lock (never held across an await). Failed downloads are remembered for a
+    shorter TTL so a broken feed isn't hammered; they never evict a good copy.
+    The last good copy is also kept past its TTL together with the response's
+    ``ETag``/``Last-Modified`` so an expired feed can be revalidated with a
+    conditional GET instead of downloaded and parsed again.
 
     This is intentionally simple; replace with Redis/Memcache for multi-process deployments.
     """
 
-    def __init__(self) -> None:
-        self._value = None
-        self._expiry_epoch = 0.0
+    def __init__(self, maxsize: int, ttl_seconds: int, failure_ttl_seconds: int) -> None:
+        self._entries: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl_seconds)
+        self._failures: TTLCache = TTLCache(maxsize=maxsize, ttl=failure_ttl_seconds)
+        # key -> (conditional request headers, articles) from the last 200 response
+        self._validated: LRUCache = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[List[NewsArticle]]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def set(
+        self,
+        key,
+        value: List[NewsArticle],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._failures.pop(key, None)
+            headers = {}
+            if etag:
+                headers["if-none-match"] = etag
+            if last_modified:
+                headers["if-modified-since"] = last_modified
+            if headers:
+                self._validated[key] = (headers, value)
+            else:
+                self._validated.pop(key, None)
+
+    def conditional_headers(self, key) -> Dict[str, str]:
+        """Request headers that let upstream answer 304 for the last good copy."""
+        with self._lock:
+            validated = self._validated.get(key)
+            return dict(validated[0]) if validated else {}
+
+    def revalidate(self, key) -> Optional[List[NewsArticle]]:
+        """Re-cache the last good copy after a 304; ``None`` if it's gone."""
+        with self._lock:
+            validated = self._validated.get(key)
+            if validated is None:
+                return None
+            self._entries[key] = validated[1]
+            self._failures.pop(key, None)
+            return validated[1]
+
+    def failed(self, key) -> bool:
+        with self._lock:
+            return key in self._failures
+
+    def set_failed(self, key) -> None:
+        with self._lock:
+            self._failures[key] = True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._failures.clear()
+            self._validated.clear()
+
+
+_feed_cache = InMemoryCache(
+    maxsize=32,
+    ttl_seconds=settings.rss_cache_ttl_seconds,
+    failure_ttl_seconds=settings.feed_failure_ttl_seconds,
+)
+
+# Pooled client shared by all async fetches; created on app startup
+_http_client: Optional[httpx.AsyncClient] = None
+# Startup cache warm-up, kept so it can be cancelled on shutdown
+_refresh_task: Optional[asyncio.Task] = None
+# Feed downloads in progress, keyed like the feed cache; concurrent misses for
+# the same feed await one shared task instead of each fetching upstream
+_inflight: Dict[Tuple[str, bool], asyncio.Task] = {}
+
+
+def _new_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=settings.http_timeout_seconds,
+        headers={"user-agent": settings.http_user_agent},
+        follow_redirects=True,
+        # All feeds live on one host, so HTTP/2 multiplexes them over one connection
+        http2=True,
+    )
 
-    def get(self):
-        if self._value is not None and time.time() < self._expiry_epoch:
-            return self._value
+
+async def start_http_client() -> None:
+    """Open the shared keep-alive client. Called from the app lifespan on startup."""
+    global _http_client
+    if _http_client is None:
+        _http_client = _new_http_client()
+
+
+async def close_http_client() -> None:
+    """Close the shared client. Called from the app lifespan on shutdown."""
+    global _http_client, _refresh_task
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        _refresh_task = None
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+@asynccontextmanager
+async def _client() -> AsyncIterator[httpx.AsyncClient]:
+    # Outside the app lifespan (scripts, bare test clients) fall back to a
+    # short-lived client so no pool outlives its event loop
+    if _http_client is not None:
+        yield _http_client
+    else:
+        async with _new_http_client() as client:
+            yield client
+
+
+def _new_article(entry) -> NewsArticle:
+    # feedparser entries are dicts; getattr only reaches the key via a failed
+    # attribute lookup and __getattr__, so read the keys directly
+    get = entry.get
+    return NewsArticle(get("title", ""), get("link", ""), get("published", ""), get("summary", ""))
+
+
+def _download_full_text(link: str) -> Optional[str]:
+    try:
+        # Fetching full text can be heavy; protect with timeout and UA
+        art = Article(link)
+        art.download()
+        art.parse()
+        return art.text or None
+    except Exception:
         return None
 
-    def set(self, value, ttl_seconds: int) -> None:
-        self._value = value
-        self._expiry_epoch = time.time() + ttl_seconds
 
+def _build_articles(entries, full_text: bool) -> List[NewsArticle]:
+    articles = [_new_article(entry) for entry in entries]
+    linked = [a for a in articles if a.link] if full_text else []
+    if linked:
+        # Downloads are network-bound, so overlap them on a few threads
+        with ThreadPoolExecutor(max_workers=settings.article_fetch_concurrency) as pool:
+            texts = pool.map(_download_full_text, [a.link for a in linked])
+            for article, text in zip(linked, texts):
+                article.full_text = text
+    # Articles are cached and served many times; serialise them once here
+    for article in articles:
+        article.to_dict()
+    return articles
+
+
+def _parse_article_html(link: str, html: str) -> Optional[str]:
+    art = Article(link)
+    art.set_html(html)
+    art.parse()
+    return art.text or None
 
-_feed_cache = InMemoryCache()
+
+async def _fetch_full_text(
+    client: httpx.AsyncClient, limit: asyncio.Semaphore, link: str
+) -> Optional[str]:
+    try:
+        async with limit:
+            response = await client.get(link)
+            response.raise_for_status()
+        # Extraction is CPU-bound lxml work, so keep it off the event loop
+        return await asyncio.to_thread(_parse_article_html, link, response.text)
+    except Exception as exc:
+        logger.warning(f"Failed to fetch full text for {link}: {exc}")
+        return None
+
+
+async def _abuild_articles(entries, full_text: bool) -> List[NewsArticle]:
+    """Async :func:`_build_articles`: full texts are downloaded concurrently.
+
+    Article pages are fetched over the pooled client, at most
+    ``article_fetch_concurrency`` at a time, so the feed takes about as long
+    as its slowest article instead of the sum of all of them.
+    """
+    articles = [_new_article(entry) for entry in entries]
+    linked = [a for a in articles if a.link] if full_text else []
+    if linked:
+        limit = asyncio.Semaphore(settings.article_fetch_concurrency)
+        async with _client() as client:
+            texts = await asyncio.gather(
+                *(_fetch_full_text(client, limit, a.link) for a in linked)
+            )
+        for article, text in zip(linked, texts):
+            article.full_text = text
+    for article in articles:
+        article.to_dict()
+    return articles
 
 
 def fetch_abc_feed(feed_name: str = "top_stories", full_text: bool = False) -> List[NewsArticle]:
@@ -57,7 +262,7 @@ def fetch_abc_feed(feed_name: str = "top_stories", full_text: bool = False) -> L
         ValueError: if feed_name is invalid
         RuntimeError: for network/parse failures
     """
-    cached = _feed_cache.get()
+    cached = _feed_cache.get((feed_name, full_text))
     if cached is not None:
         return cached
 
@@ -68,26 +273,99 @@ def fetch_abc_feed(feed_name: str = "top_stories", full_text: bool = False) -> L
     try:
         # Use feedparser directly; it will perform HTTP get
         parsed = feedparser.parse(str(feed_url))
-        articles: List[NewsArticle] = []
-        for entry in parsed.entries:
-            article = NewsArticle(
-                title=getattr(entry, "title", ""),
-                link=getattr(entry, "link", ""),
-                published=getattr(entry, "published", ""),
-                summary=getattr(entry, "summary", ""),
-            )
-            if full_text and article.link:
-                try:
-                    # Fetching full text can be heavy; protect with timeout and UA
-                    art = Article(article.link)
-                    art.download()
-                    art.parse()
-                    article.full_text = art.text or None
-                except Exception:
-                    article.full_text = None
-            articles.append(article)
-
-        _feed_cache.set(articles, settings.rss_cache_ttl_seconds)
+        articles = _build_articles(parsed.entries, full_text)
+        _feed_cache.set((feed_name, full_text), articles)
         return articles
     except (requests.RequestException, Exception) as exc:  # pragma: no cover - feedparser may swallow requests exceptions
         raise RuntimeError(f"Failed to fetch or parse feed: {exc}")
+
+
+async def afetch_abc_feed(
+    feed_name: str = "top_stories", full_text: bool = False, fresh: bool = False
+) -> List[NewsArticle]:
+    """Async variant of :func:`fetch_abc_feed` for use inside request handlers.
+
+    The feed is downloaded over the shared pooled client, so repeated fetches
+    reuse keep-alive connections, and parsing runs in a worker thread so the
+    event loop is never blocked. Concurrent cache misses for the same feed
+    share a single download, and an expired feed is revalidated with a
+    conditional GET. ``fresh`` skips the cached copy and refetches.
+    """
+    key = (feed_name, full_text)
+    if not fresh:
+        cached = _feed_cache.get(key)
+        if cached is not None:
+            return cached
+        if _feed_cache.failed(key):
+            return []
+
+    feed_url = settings.abc_feeds.get(feed_name)
+    if not feed_url:
+        raise ValueError(f"Invalid feed name: {feed_name}")
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_download_feed(feed_name, feed_url, full_text))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shielded so one disconnecting client doesn't cancel the others' fetch
+    return await asyncio.shield(task)
+
+
+async def _download_feed(
+    feed_name: str, feed_url: str, full_text: bool, conditional: bool = True
+) -> List[NewsArticle]:
+    key = (feed_name, full_text)
+    headers = _feed_cache.conditional_headers(key) if conditional else {}
+    try:
+        async with _client() as client:
+            response = await client.get(str(feed_url), headers=headers)
+            # httpx treats every non-2xx status as an error, 304 included
+            if response.status_code != 304:
+                response.raise_for_status()
+    except httpx.HTTPError as exc:
+        # Match feedparser's own fetching, which reports an unreachable feed
+        # as empty rather than raising; only remember the failure briefly
+        logger.warning(f"Failed to download feed {feed_name}: {exc}")
+        _feed_cache.set_failed(key)
+        return []
+
+    if response.status_code == 304:
+        articles = _feed_cache.revalidate(key)
+        if articles is not None:
+            return articles
+        # The validated copy was evicted while the request was in flight
+        return await _download_feed(feed_name, feed_url, full_text, conditional=False)
+
+    return await _parse_feed(key, response)
+
+
+async def _parse_feed(key: Tuple[str, bool], response: httpx.Response) -> List[NewsArticle]:
+    try:
+        parsed = await asyncio.to_thread(feedparser.parse, response.content)
+        articles = await _abuild_articles(parsed.entries, key[1])
+        _feed_cache.set(
+            key,
+            articles,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+        return articles
+    except Exception as exc:
+        raise RuntimeError(f"Failed to fetch or parse feed: {exc}")
+
+
+async def refresh_all_feeds() -> None:
+    """Fetch every configured feed concurrently to warm the feed cache."""
+    names = list(settings.abc_feeds)
+    results = await asyncio.gather(*(afetch_abc_feed(name) for name in names), return_exceptions=True)
+    for name, result in zip(names, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to prefetch feed {name}: {result}")
+
+
+async def start_feed_refresh() -> None:
+    """Warm the feed cache in the background. Called from the app lifespan on startup."""
+    global _refresh_task
+    if settings.prefetch_feeds_on_startup and _refresh_task is None:
+        _refresh_task = asyncio.create_task(refresh_all_feeds())
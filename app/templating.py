@@ -0,0 +1,44 @@
+"""Shared Jinja2 environment for every router.
+
+One ``Jinja2Templates`` instance means one parsed-template cache, plus an
+on-disk bytecode cache so a restarted worker skips recompiling templates.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import jinja2
+from fastapi.templating import Jinja2Templates
+
+from app.config import settings
+
+TEMPLATE_DIR = "app/templates"
+BYTECODE_CACHE_DIR = Path(__file__).resolve().parent / ".jinja_cache"
+
+
+class LazyBytecodeCache(jinja2.FileSystemBytecodeCache):
+    """Bytecode cache that creates its directory on first write.
+
+    Nothing touches the filesystem at import, and on a read-only filesystem
+    templates are simply compiled in memory instead of failing the app.
+    """
+
+    def dump_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+
+# StrictUndefined surfaces template typos during development; production keeps
+# the lenient default so a missing value renders empty instead of raising.
+templates = Jinja2Templates(
+    directory=TEMPLATE_DIR,
+    auto_reload=settings.debug,
+    cache_size=400,
+    bytecode_cache=LazyBytecodeCache(str(BYTECODE_CACHE_DIR)),
+    undefined=jinja2.StrictUndefined if settings.debug else jinja2.Undefined,
+)
@@ -15,12 +15,16 @@ import time
 import requests
 import json
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from docker_ops import (
+    IMAGE_NAME, Colors, print_error, print_status, print_success, print_warning, run_command
+)
+
 # Configuration
-DOCKER_HUB_USERNAME = "tommyboy777"
-IMAGE_NAME = f"{DOCKER_HUB_USERNAME}/nlp-dashboard"
 CONTAINER_NAME = "nlp-dashboard-container"
 PORT_HOST = 8001  # Using port 8001 to avoid conflict with fraud dashboard on port 80
 PORT_CONTAINER = 8000
@@ -31,52 +35,28 @@ DROPLET_USER = "root"  # Usually 'root' for Digital Ocean
 SSH_KEY_PATH = "C:/Users/tommy/.ssh/id_rsa"  # Path to your SSH private key
 DOMAIN = "YOUR_DOMAIN.com"  # Optional: your domain name
 
-class Colors:
-    """ANSI color codes for terminal output"""
-    GREEN = '\033[92m'
-    RED = '\033[91m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
-
-def print_status(message: str, color: str = Colors.BLUE) -> None:
-    """Print a status message with color"""
-    print(f"{color}{Colors.BOLD}[INFO]{Colors.END} {message}")
-
-def print_success(message: str) -> None:
-    """Print a success message"""
-    print(f"{Colors.GREEN}{Colors.BOLD}[SUCCESS]{Colors.END} {message}")
+# Share one authenticated SSH connection across every ssh/scp call for 60s
+# instead of handshaking per command. The Windows OpenSSH client has no
+# ControlMaster support, so there each call keeps its own connection.
+SSH_MUX_OPTIONS = [] if os.name == "nt" else [
+    "-o", "ControlMaster=auto",
+    "-o", f"ControlPath={tempfile.gettempdir()}/nlp-deploy-%C",
+    "-o", "ControlPersist=60s",
+]
 
-def print_error(message: str) -> None:
-    """Print an error message"""
-    print(f"{Colors.RED}{Colors.BOLD}[ERROR]{Colors.END} {message}")
+def ssh_command(remote_command: str) -> List[str]:
+    """Build an ssh invocation running remote_command on the droplet"""
+    return [
+        "ssh", "-i", os.path.expanduser(SSH_KEY_PATH), *SSH_MUX_OPTIONS,
+        f"{DROPLET_USER}@{DROPLET_IP}", remote_command
+    ]
 
-def print_warning(message: str) -> None:
-    """Print a warning message"""
-    print(f"{Colors.YELLOW}{Colors.BOLD}[WARNING]{Colors.END} {message}")
-
-def run_command(command: List[str], check: bool = True) -> subprocess.CompletedProcess:
-    """Run a shell command and return the result"""
-    start_time = time.time()
-    print_status(f"Running: {' '.join(command)}")
-    try:
-        result = subprocess.run(command, capture_output=True, text=True, check=check)
-        elapsed = time.time() - start_time
-        if result.stdout:
-            print(f"{Colors.BLUE}[STDOUT]{Colors.END} {result.stdout}")
-        if result.stderr:
-            print(f"{Colors.YELLOW}[STDERR]{Colors.END} {result.stderr}")
-        print_success(f"Command completed in {elapsed:.2f}s")
-        return result
-    except subprocess.CalledProcessError as e:
-        elapsed = time.time() - start_time
-        print_error(f"Command failed after {elapsed:.2f}s: {' '.join(command)}")
-        if e.stderr:
-            print(f"{Colors.RED}[ERROR]{Colors.END} {e.stderr}")
-        if check:
-            raise
-        return e
+def scp_command(local_path: str, remote_path: str) -> List[str]:
+    """Build an scp invocation copying local_path to remote_path on the droplet"""
+    return [
+        "scp", "-i", os.path.expanduser(SSH_KEY_PATH), *SSH_MUX_OPTIONS,
+        local_path, f"{DROPLET_USER}@{DROPLET_IP}:{remote_path}"
+    ]
 
 def check_prerequisites() -> bool:
     """Check if all prerequisites are met"""
@@ -95,10 +75,9 @@ def check_prerequisites() -> bool:
     
     # Check if we can connect to the droplet
     try:
-        result = run_command([
-            "ssh", "-i", ssh_key_path, f"{DROPLET_USER}@{DROPLET_IP}",
+        result = run_command(ssh_command(
             "echo 'SSH connection successful'"
-        ], check=False)
+        ), check=False)
         
         if result.returncode == 0:
             print_success("SSH connection to droplet successful")
@@ -112,44 +91,42 @@ def check_prerequisites() -> bool:
     
     return True
 
+# Remote provisioning and deploy steps, each sent as one script so a phase costs
+# a single SSH round-trip. `set -x` echoes every command into the captured
+# stderr, and the step banners mirror the per-step status lines printed before.
+SETUP_SCRIPT = """set -euxo pipefail
+echo 'Step 1/3: Updating system packages...'
+apt-get update && apt-get upgrade -y
+echo 'Step 2/3: Installing Docker...'
+curl -fsSL https://get.docker.com -o get-docker.sh && sh get-docker.sh
+echo 'Step 3/3: Installing Docker Compose...'
+curl -L "https://github.com/docker/compose/releases/download/v2.20.0/docker-compose-$(uname -s)-$(uname -m)" -o /usr/local/bin/docker-compose && chmod +x /usr/local/bin/docker-compose
+"""
+
+DEPLOY_SCRIPT = f"""set -euxo pipefail
+echo 'Step 1/4: Stopping existing container...'
+docker stop {CONTAINER_NAME} || true
+docker rm {CONTAINER_NAME} || true
+echo 'Step 2/4: Pulling latest Docker image...'
+docker pull {IMAGE_NAME}
+echo 'Step 3/4: Starting container...'
+docker run -d --name {CONTAINER_NAME} -p {PORT_HOST}:{PORT_CONTAINER} --restart unless-stopped {IMAGE_NAME}
+echo 'Step 4/4: Verifying container status...'
+docker ps | grep {CONTAINER_NAME}
+"""
+
+def run_remote_script(script: str, check: bool = True) -> subprocess.CompletedProcess:
+    """Run a multi-line shell script on the droplet over a single SSH session"""
+    # Text-mode pipes on Windows turn \n into \r\n, so strip CRs before bash reads it
+    return run_command(ssh_command("tr -d '\\r' | bash -s"), check=check, input=script)
+
 def setup_droplet() -> bool:
     """Set up the droplet with Docker and required software"""
     print_status("Setting up droplet...")
     start_time = time.time()
     
-    ssh_key_path = os.path.expanduser(SSH_KEY_PATH)
-    
     try:
-        # Update system
-        print_status("Step 1/3: Updating system packages...")
-        step_start = time.time()
-        run_command([
-            "ssh", "-i", ssh_key_path, f"{DROPLET_USER}@{DROPLET_IP}",
-            "apt-get update && apt-get upgrade -y"
-        ])
-        step_time = time.time() - step_start
-        print_success(f"System update completed in {step_time:.2f}s")
-        
-        # Install Docker
-        print_status("Step 2/3: Installing Docker...")
-        step_start = time.time()
-        run_command([
-            "ssh", "-i", ssh_key_path, f"{DROPLET_USER}@{DROPLET_IP}",
-            "curl -fsSL https://get.docker.com -o get-docker.sh && sh get-docker.sh"
-        ])
-        step_time = time.time() - step_start
-        print_success(f"Docker installation completed in {step_time:.2f}s")
-        
-        # Install Docker Compose
-        print_status("Step 3/3: Installing Docker Compose...")
-        step_start = time.time()
-        run_command([
-            "ssh", "-i", ssh_key_path, f"{DROPLET_USER}@{DROPLET_IP}",
-            "curl -L \"https://github.com/docker/compose/releases/download/v2.20.0/docker-compose-$(uname -s)-$(uname -m)\" -o /usr/local/bin/docker-compose && chmod +x /usr/local/bin/docker-compose"
-        ])
-        step_time = time.time() - step_start
-        print_success(f"Docker Compose installation completed in {step_time:.2f}s")
-        
+        run_remote_script(SETUP_SCRIPT)
         total_time = time.time() - start_time
         print_success(f"Droplet setup completed in {total_time:.2f}s")
         return True
@@ -164,54 +141,8 @@ def deploy_to_droplet() -> bool:
     print_status("Deploying to droplet...")
     start_time = time.time()
     
-    ssh_key_path = os.path.expanduser(SSH_KEY_PATH)
-    
     try:
-        # Stop and remove existing container
-        print_status("Step 1/4: Stopping existing container...")
-        step_start = time.time()
-        run_command([
-            "ssh", "-i", ssh_key_path, f"{DROPLET_USER}@{DROPLET_IP}",
-            f"docker stop {CONTAINER_NAME} || true"
-        ], check=False)
-        
-        run_command([
-            "ssh", "-i", ssh_key_path, f"{DROPLET_USER}@{DROPLET_IP}",
-            f"docker rm {CONTAINER_NAME} || true"
-        ], check=False)
-        step_time = time.time() - step_start
-        print_success(f"Container cleanup completed in {step_time:.2f}s")
-        
-        # Pull the latest image
-        print_status("Step 2/4: Pulling latest Docker image...")
-        step_start = time.time()
-        run_command([
-            "ssh", "-i", ssh_key_path, f"{DROPLET_USER}@{DROPLET_IP}",
-            f"docker pull {IMAGE_NAME}"
-        ])
-        step_time = time.time() - step_start
-        print_success(f"Image pull completed in {step_time:.2f}s")
-        
-        # Run the container
-        print_status("Step 3/4: Starting container...")
-        step_start = time.time()
-        run_command([
-            "ssh", "-i", ssh_key_path, f"{DROPLET_USER}@{DROPLET_IP}",
-            f"docker run -d --name {CONTAINER_NAME} -p {PORT_HOST}:{PORT_CONTAINER} --restart unless-stopped {IMAGE_NAME}"
-        ])
-        step_time = time.time() - step_start
-        print_success(f"Container started in {step_time:.2f}s")
-        
-        # Verify container is running
-        print_status("Step 4/4: Verifying container status...")
-        step_start = time.time()
-        run_command([
-            "ssh", "-i", ssh_key_path, f"{DROPLET_USER}@{DROPLET_IP}",
-            f"docker ps | grep {CONTAINER_NAME}"
-        ])
-        step_time = time.time() - step_start
-        print_success(f"Container verification completed in {step_time:.2f}s")
-        
+        run_remote_script(DEPLOY_SCRIPT)
         total_time = time.time() - start_time
         print_success(f"Deployment to droplet completed in {total_time:.2f}s")
         return True
@@ -225,14 +156,11 @@ def setup_nginx_proxy() -> bool:
     """Set up Nginx as a reverse proxy (optional)"""
     print_status("Setting up Nginx reverse proxy...")
     
-    ssh_key_path = os.path.expanduser(SSH_KEY_PATH)
-    
     try:
         # Install Nginx
-        run_command([
-            "ssh", "-i", ssh_key_path, f"{DROPLET_USER}@{DROPLET_IP}",
+        run_command(ssh_command(
             "apt-get install -y nginx"
-        ])
+        ))
         
         # Create Nginx configuration
         nginx_config = f"""
@@ -254,15 +182,12 @@ server {{
         with open("nginx_config", "w") as f:
             f.write(nginx_config)
         
-        run_command([
-            "scp", "-i", ssh_key_path, "nginx_config", f"{DROPLET_USER}@{DROPLET_IP}:/etc/nginx/sites-available/nlp-dashboard"
-        ])
+        run_command(scp_command("nginx_config", "/etc/nginx/sites-available/nlp-dashboard"))
         
         # Enable site and restart Nginx
-        run_command([
-            "ssh", "-i", ssh_key_path, f"{DROPLET_USER}@{DROPLET_IP}",
+        run_command(ssh_command(
             "ln -sf /etc/nginx/sites-available/nlp-dashboard /etc/nginx/sites-enabled/ && nginx -t && systemctl restart nginx"
-        ])
+        ))
         
         # Clean up local file
         os.remove("nginx_config")
@@ -278,14 +203,11 @@ def setup_firewall() -> bool:
     """Set up firewall rules"""
     print_status("Setting up firewall...")
     
-    ssh_key_path = os.path.expanduser(SSH_KEY_PATH)
-    
     try:
         # Allow SSH, HTTP, HTTPS, and the app port
-        run_command([
-            "ssh", "-i", ssh_key_path, f"{DROPLET_USER}@{DROPLET_IP}",
+        run_command(ssh_command(
             "ufw allow ssh && ufw allow 80 && ufw allow 443 && ufw allow {PORT_HOST} && ufw --force enable"
-        ])
+        ))
         
         print_success("Firewall configured")
         return True
@@ -299,46 +221,43 @@ def wait_for_service() -> bool:
     print_status("Waiting for service to be ready...")
     
     start_time = time.time()
-    max_wait_time = 120  # 2 minutes
-    attempts = 0
+    max_wait_time = 120  # seconds
+    
+    # Poll from the droplet itself so each retry is a localhost request rather
+    # than a fresh connection across the WAN; the whole wait is one SSH call.
+    # /healthz holds each probe for a few seconds while models warm up, so
+    # the deadline is on elapsed time rather than a probe count.
+    result = run_command(ssh_command(
+        f"end=$((SECONDS+{max_wait_time})); while [ $SECONDS -lt $end ]; do "
+        f"curl -fs -o /dev/null --max-time 10 http://localhost:{PORT_HOST}/healthz && exit 0; "
+        f"sleep 1; done; exit 1"
+    ), check=False)
+    if result.returncode != 0:
+        total_time = time.time() - start_time
+        print_error(f"Service health check failed after {total_time:.1f}s")
+        return False
     
-    while time.time() - start_time < max_wait_time:
-        attempts += 1
-        elapsed = time.time() - start_time
-        print_status(f"Health check attempt {attempts} (elapsed: {elapsed:.1f}s)")
-        
-        try:
-            response = requests.get(f"http://{DROPLET_IP}:{PORT_HOST}/home", timeout=10)
-            if response.status_code == 200:
-                total_time = time.time() - start_time
-                print_success(f"Service is ready after {total_time:.1f}s!")
-                return True
-        except requests.RequestException as e:
-            print_warning(f"Health check failed: {e}")
-        
-        remaining = max_wait_time - elapsed
-        if remaining > 5:
-            print_status(f"Service not ready yet, waiting 5s... (remaining: {remaining:.1f}s)")
-            time.sleep(5)
-        else:
-            break
+    # One probe from here confirms the port is also reachable from outside
+    try:
+        response = requests.get(f"http://{DROPLET_IP}:{PORT_HOST}/healthz", timeout=10)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print_error(f"Service is up on the droplet but not reachable externally: {e}")
+        return False
     
     total_time = time.time() - start_time
-    print_error(f"Service health check failed after {total_time:.1f}s")
-    return False
+    print_success(f"Service is ready after {total_time:.1f}s!")
+    return True
 
 def run_remote_tests() -> bool:
     """Run tests on the remote server"""
     print_status("Running remote tests...")
     
-    ssh_key_path = os.path.expanduser(SSH_KEY_PATH)
-    
     try:
         # Test basic connectivity
-        result = run_command([
-            "ssh", "-i", ssh_key_path, f"{DROPLET_USER}@{DROPLET_IP}",
+        result = run_command(ssh_command(
             f"curl -f http://localhost:{PORT_HOST}/home"
-        ], check=False)
+        ), check=False)
         
         if result.returncode == 0:
             print_success("Basic connectivity test passed")
@@ -387,27 +306,28 @@ def main() -> int:
     if not check_prerequisites():
         return 1
     
+    # Ask before the long-running phases so the deploy needs no further input
+    setup_nginx = input("Set up Nginx reverse proxy? (y/n): ").lower().strip()
+    
     # Set up droplet
     print_status("Phase 2/6: Setting up droplet...")
     if not setup_droplet():
         return 1
     
-    # Deploy application
-    print_status("Phase 3/6: Deploying application...")
-    if not deploy_to_droplet():
-        return 1
-    
-    # Set up firewall
-    print_status("Phase 4/6: Setting up firewall...")
-    if not setup_firewall():
-        print_warning("Firewall setup failed, but continuing...")
-    
-    # Set up Nginx (optional)
-    print_status("Phase 5/6: Configuring Nginx (optional)...")
-    setup_nginx = input("Set up Nginx reverse proxy? (y/n): ").lower().strip()
-    if setup_nginx == 'y':
-        if not setup_nginx_proxy():
+    # Deploy, firewall and Nginx touch independent parts of the droplet, so run
+    # them side by side; the container stop/pull/run stays ordered in one script
+    print_status("Phases 3-5/6: Deploying application, setting up firewall and Nginx...")
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        deployed = pool.submit(deploy_to_droplet)
+        firewall = pool.submit(setup_firewall)
+        nginx = pool.submit(setup_nginx_proxy) if setup_nginx == 'y' else None
+        
+        if not firewall.result():
+            print_warning("Firewall setup failed, but continuing...")
+        if nginx is not None and not nginx.result():
             print_warning("Nginx setup failed, but continuing...")
+        if not deployed.result():
+            return 1
     
     # Wait for service
     print_status("Phase 6/6: Waiting for service to be ready...")
@@ -14,12 +14,14 @@ import subprocess
 import sys
 import time
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Callable
 
 # Import the deployment functions
-from deploy_local_docker_hub import (
-    check_docker_installed, check_docker_running, check_docker_login,
-    build_and_push_to_dockerhub, print_status, print_success, print_error, print_warning
+from docker_ops import (
+    Colors, abort_running_commands, build_and_push_to_dockerhub, ensure_docker,
+    output_label, print_error, print_success, print_warning
 )
 
 from deploy_droplet import (
@@ -27,18 +29,16 @@ from deploy_droplet import (
     wait_for_service, run_remote_tests, print_deployment_info
 )
 
-class Colors:
-    """ANSI color codes for terminal output"""
-    GREEN = '\033[92m'
-    RED = '\033[91m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
+_WORKFLOW = f"{Colors.BLUE}{Colors.BOLD}[WORKFLOW]{Colors.END} "
 
 def print_workflow_status(message: str) -> None:
     """Print a workflow status message"""
-    print(f"{Colors.BLUE}{Colors.BOLD}[WORKFLOW]{Colors.END} {message}")
+    sys.stdout.write(_WORKFLOW + message + "\n")
+
+def _labelled(label: str, phase: Callable[[], bool]) -> bool:
+    """Run ``phase`` with its output prefixed by ``[label]``"""
+    with output_label(label):
+        return phase()
 
 def main() -> int:
     """Main workflow function"""
@@ -49,45 +49,46 @@ def main() -> int:
     # Phase 1: Local Docker Hub Setup
     print_workflow_status("Phase 1/4: Setting up local Docker environment...")
     
-    if not check_docker_installed():
-        return 1
-    
-    if not check_docker_running():
-        return 1
-    
-    if not check_docker_login():
-        print_warning("Please login to Docker Hub first: docker login")
-        return 1
-    
-    # Phase 2: Build and Push to Docker Hub
-    print_workflow_status("Phase 2/4: Building and pushing to Docker Hub...")
-    if not build_and_push_to_dockerhub():
-        print_error("Failed to build and push to Docker Hub")
+    if not ensure_docker():
         return 1
     
-    # Phase 3: Droplet Prerequisites
-    print_workflow_status("Phase 3/4: Checking droplet prerequisites...")
+    # Phase 2: Droplet Prerequisites
+    print_workflow_status("Phase 2/4: Checking droplet prerequisites...")
     if not check_prerequisites():
         print_error("Droplet prerequisites check failed")
         return 1
     
+    # Ask everything up front so the long phases below run unattended
+    setup_choice = input("Set up droplet with Docker? (y/n): ").lower().strip()
+    firewall_choice = input("Set up firewall? (y/n): ").lower().strip()
+    test_choice = input("Run remote tests? (y/n): ").lower().strip()
+    
+    # Phase 3: Build and push while the droplet is provisioned; neither needs
+    # the other, and the deploy only starts once both are done
+    print_workflow_status("Phase 3/4: Building and pushing to Docker Hub...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        phases = {executor.submit(_labelled, "build", build_and_push_to_dockerhub): "Failed to build and push to Docker Hub"}
+        if setup_choice == 'y':
+            print_workflow_status("Setting up droplet during the build...")
+            phases[executor.submit(_labelled, "droplet", setup_droplet)] = "Failed to set up droplet"
+        for future in as_completed(phases):
+            error = future.exception()
+            if error is not None or not future.result():
+                print_error(phases[future] + (f": {error}" if error is not None else ""))
+                # Stop the other phase's command rather than waiting minutes
+                # for it before the executor can shut down
+                abort_running_commands()
+                return 1
+    
     # Phase 4: Deploy to Droplet
     print_workflow_status("Phase 4/4: Deploying to droplet...")
     
-    # Set up droplet (only if needed)
-    setup_choice = input("Set up droplet with Docker? (y/n): ").lower().strip()
-    if setup_choice == 'y':
-        if not setup_droplet():
-            print_error("Failed to set up droplet")
-            return 1
-    
     # Deploy application
     if not deploy_to_droplet():
         print_error("Failed to deploy to droplet")
         return 1
     
     # Set up firewall
-    firewall_choice = input("Set up firewall? (y/n): ").lower().strip()
     if firewall_choice == 'y':
         if not setup_firewall():
             print_warning("Firewall setup failed, but continuing...")
@@ -98,7 +99,6 @@ def main() -> int:
         return 1
     
     # Run remote tests
-    test_choice = input("Run remote tests? (y/n): ").lower().strip()
     if test_choice == 'y':
         if not run_remote_tests():
             print_warning("Some remote tests failed")
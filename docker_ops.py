@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the NLP Dashboard deployment scripts
+
+Console output, command execution and the Docker / Docker Hub steps used by
+deploy_local_docker_hub.py, push_to_dockerhub.py, deploy_droplet.py and
+deploy_workflow.py live here so each fix only has to be made once.
+"""
+
+import functools
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Iterator, List, Optional, Set
+
+# Configuration
+DOCKER_HUB_USERNAME = "tommyboy777"  # Your Docker Hub username
+IMAGE_NAME = f"{DOCKER_HUB_USERNAME}/nlp-dashboard"
+# Key Docker Hub credentials are stored under in the Docker client config
+DOCKER_HUB_SERVER = "https://index.docker.io/v1/"
+
+class Colors:
+    """ANSI color codes for terminal output"""
+    GREEN = '\033[92m'
+    RED = '\033[91m'
+    YELLOW = '\033[93m'
+    BLUE = '\033[94m'
+    BOLD = '\033[1m'
+    END = '\033[0m'
+
+# Keep escape codes out of redirected logs, and honour NO_COLOR (no-color.org)
+if not sys.stdout.isatty() or os.environ.get("NO_COLOR"):
+    for _name in ("GREEN", "RED", "YELLOW", "BLUE", "BOLD", "END"):
+        setattr(Colors, _name, "")
+
+# Message prefixes, formatted once rather than on every call
+_INFO = f"{Colors.BLUE}{Colors.BOLD}[INFO]{Colors.END} "
+_SUCCESS = f"{Colors.GREEN}{Colors.BOLD}[SUCCESS]{Colors.END} "
+_ERROR = f"{Colors.RED}{Colors.BOLD}[ERROR]{Colors.END} "
+_WARNING = f"{Colors.YELLOW}{Colors.BOLD}[WARNING]{Colors.END} "
+
+# Per-thread label naming the phase a line of output belongs to
+_output = threading.local()
+
+@contextmanager
+def output_label(label: str) -> Iterator[None]:
+    """Prefix everything this thread prints with ``[label]``
+
+    Lets the output of phases running side by side be told apart.
+    """
+    previous = getattr(_output, "prefix", "")
+    _output.prefix = f"{Colors.BOLD}[{label}]{Colors.END} "
+    try:
+        yield
+    finally:
+        _output.prefix = previous
+
+def _write(line: str) -> None:
+    # One write per line so messages from concurrent phases don't interleave
+    sys.stdout.write(getattr(_output, "prefix", "") + line)
+
+def print_status(message: str, color: str = Colors.BLUE) -> None:
+    """Print a status message with color"""
+    prefix = _INFO if color == Colors.BLUE else f"{color}{Colors.BOLD}[INFO]{Colors.END} "
+    _write(prefix + message + "\n")
+
+def print_success(message: str) -> None:
+    """Print a success message"""
+    _write(_SUCCESS + message + "\n")
+
+def print_error(message: str) -> None:
+    """Print an error message"""
+    _write(_ERROR + message + "\n")
+
+def print_warning(message: str) -> None:
+    """Print a warning message"""
+    _write(_WARNING + message + "\n")
+
+# Lines of output kept for the returned result and for error reports
+OUTPUT_TAIL_LINES = 200
+
+# Commands in flight, so a failed phase can stop the ones running beside it
+_running: Set[subprocess.Popen] = set()
+_running_lock = threading.Lock()
+_aborted = threading.Event()
+
+def abort_running_commands() -> None:
+    """Terminate every command started by run_command and refuse new ones
+
+    Used when one of several concurrent phases fails, so the script can
+    exit now rather than after the other phase's build or setup finishes.
+    """
+    _aborted.set()
+    with _running_lock:
+        for proc in _running:
+            proc.terminate()
+
+def run_command(command: List[str], check: bool = True, input: Optional[str] = None) -> subprocess.CompletedProcess:
+    """Run a shell command, optionally feeding input to its stdin, and return the result
+
+    Output (stdout and stderr merged) is echoed line by line as it arrives, so
+    long builds show live progress; only the last OUTPUT_TAIL_LINES lines are
+    kept, as the result's ``stdout``.
+    """
+    start_time = time.time()
+    if _aborted.is_set():
+        print_error(f"Not running (aborted): {' '.join(command)}")
+        if check:
+            raise subprocess.CalledProcessError(-1, command)
+        return subprocess.CompletedProcess(command, -1, stdout="")
+    print_status(f"Running: {' '.join(command)}")
+    tail: Deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+    with subprocess.Popen(
+        command,
+        stdin=subprocess.PIPE if input is not None else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    ) as proc:
+        with _running_lock:
+            _running.add(proc)
+            # An abort between the check above and Popen must still stop it
+            if _aborted.is_set():
+                proc.terminate()
+        try:
+            if input is not None:
+                try:
+                    proc.stdin.write(input)
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    # The command exited (or was terminated) early; its exit
+                    # status below reports the failure
+                    pass
+            for line in proc.stdout:
+                _write(line)
+                tail.append(line)
+        finally:
+            with _running_lock:
+                _running.discard(proc)
+    result = subprocess.CompletedProcess(command, proc.returncode, stdout="".join(tail))
+    elapsed = time.time() - start_time
+    if result.returncode == 0:
+        print_success(f"Command completed in {elapsed:.2f}s")
+        return result
+    print_error(f"Command failed after {elapsed:.2f}s: {' '.join(command)}")
+    if check:
+        raise subprocess.CalledProcessError(result.returncode, command, output=result.stdout)
+    return result
+
+def check_docker_installed() -> bool:
+    """Check if Docker is installed"""
+    # A PATH lookup is enough here; check_docker_running talks to the daemon
+    path = shutil.which("docker")
+    if not path:
+        print_error("Docker command not found. Please install Docker Desktop.")
+        return False
+    print_success(f"Docker found at {path}")
+    return True
+
+@functools.lru_cache(maxsize=1)
+def docker_info() -> subprocess.CompletedProcess:
+    """Run ``docker info`` once per process and reuse its output
+
+    Each call round-trips to the daemon (1-3s under Docker Desktop).
+    """
+    return run_command(["docker", "info"], check=False)
+
+def check_docker_running() -> bool:
+    """Check if Docker daemon is running"""
+    try:
+        result = docker_info()
+        if result.returncode == 0:
+            print_success("Docker daemon is running")
+            return True
+        else:
+            print_error("Docker daemon is not running. Please start Docker Desktop.")
+            return False
+    except Exception as e:
+        print_error(f"Failed to check Docker status: {e}")
+        return False
+
+def _docker_hub_logged_in() -> bool:
+    """Whether the Docker client holds Docker Hub credentials
+
+    Reads the client config the way ``docker login`` writes it: inline
+    ``auths`` credentials, or else a credential helper asked once for the
+    servers it has stored.
+    """
+    config_dir = os.environ.get("DOCKER_CONFIG") or os.path.join(os.path.expanduser("~"), ".docker")
+    try:
+        with open(os.path.join(config_dir, "config.json"), encoding="utf-8") as f:
+            config = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if config.get("auths", {}).get(DOCKER_HUB_SERVER, {}).get("auth"):
+        return True
+    helper = config.get("credHelpers", {}).get(DOCKER_HUB_SERVER) or config.get("credsStore")
+    if not helper:
+        return False
+    try:
+        result = subprocess.run(
+            [f"docker-credential-{helper}", "list"], capture_output=True, text=True, timeout=10
+        )
+        return result.returncode == 0 and DOCKER_HUB_SERVER in json.loads(result.stdout or "{}")
+    except (OSError, subprocess.TimeoutExpired, ValueError):
+        return False
+
+def check_docker_login() -> bool:
+    """Check if user is logged into Docker Hub"""
+    if _docker_hub_logged_in():
+        print_success("Logged into Docker Hub")
+        return True
+    print_warning("Not logged into Docker Hub. Please run: docker login")
+    return False
+
+@functools.lru_cache(maxsize=1)
+def ensure_docker() -> bool:
+    """Check Docker is installed, running and logged into Docker Hub
+
+    Cached, so scripts that import one another only run the checks once.
+    """
+    if not check_docker_installed() or not check_docker_running():
+        return False
+    if not check_docker_login():
+        print_warning("Please login to Docker Hub first: docker login")
+        return False
+    return True
+
+def build_and_push_to_dockerhub(image: str = IMAGE_NAME) -> bool:
+    """Build and push the Docker image to Docker Hub"""
+    print_status("Building and pushing to Docker Hub...")
+    start_time = time.time()
+
+    try:
+        # One BuildKit run pushes layers as soon as they are built. The inline
+        # cache metadata travels with the pushed image, so the next build can
+        # reuse unchanged layers from Docker Hub even on a clean machine.
+        run_command([
+            "docker", "buildx", "build",
+            "--push",
+            "--tag", image,
+            "--cache-to", "type=inline",
+            "--cache-from", f"type=registry,ref={image}",
+            "--provenance=false",
+            "."
+        ])
+
+        total_time = time.time() - start_time
+        print_success(f"Image built and pushed to Docker Hub: {image}")
+        print_success(f"Total build and push time: {total_time:.2f}s")
+        return True
+    except subprocess.CalledProcessError:
+        total_time = time.time() - start_time
+        print_error(f"Failed to build and push Docker image after {total_time:.2f}s")
+        return False
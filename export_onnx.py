@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Export and quantize the DistilBERT models to int8 ONNX
+
+Exports the emotion and QA models with optimum, applies dynamic int8
+quantization and writes them to app/models/onnx/<task>/, where the app picks
+them up automatically when running on CPU.
+
+Requires: pip install "optimum[onnxruntime]"
+
+Usage:
+    python export_onnx.py
+"""
+
+import sys
+from pathlib import Path
+
+from app.config import settings
+
+MODELS = {
+    "emotion": ("bhadresh-savani/distilbert-base-uncased-emotion", "ORTModelForSequenceClassification"),
+    "qa": ("distilbert/distilbert-base-cased-distilled-squad", "ORTModelForQuestionAnswering"),
+}
+
+
+def export(name: str, model_id: str, ort_class: str) -> None:
+    """Export one model to ONNX and quantize it in place"""
+    from optimum import onnxruntime as ort
+    from optimum.onnxruntime import ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from transformers import AutoTokenizer
+
+    out_dir = Path(settings.onnx_model_dir) / name
+    print(f"Exporting {model_id} -> {out_dir}")
+    model = getattr(ort, ort_class).from_pretrained(model_id, export=True)
+    model.save_pretrained(out_dir)
+    AutoTokenizer.from_pretrained(model_id).save_pretrained(out_dir)
+
+    quantizer = ORTQuantizer.from_pretrained(out_dir)
+    qconfig = AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+    quantizer.quantize(save_dir=out_dir, quantization_config=qconfig)
+
+
+def main() -> int:
+    try:
+        import optimum.onnxruntime  # noqa: F401
+    except ImportError:
+        print('optimum is not installed: pip install "optimum[onnxruntime]"')
+        return 1
+    for name, (model_id, ort_class) in MODELS.items():
+        export(name, model_id, ort_class)
+    print("Done")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
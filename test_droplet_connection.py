@@ -12,35 +12,10 @@ import subprocess
 import sys
 import os
 
-# Configuration (same as deploy_droplet.py)
-DROPLET_IP = "209.38.89.159"
-DROPLET_USER = "root"
-SSH_KEY_PATH = "C:/Users/tommy/.ssh/id_rsa"
-
-class Colors:
-    """ANSI color codes for terminal output"""
-    GREEN = '\033[92m'
-    RED = '\033[91m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
-
-def print_status(message: str) -> None:
-    """Print a status message with color"""
-    print(f"{Colors.BLUE}{Colors.BOLD}[INFO]{Colors.END} {message}")
-
-def print_success(message: str) -> None:
-    """Print a success message"""
-    print(f"{Colors.GREEN}{Colors.BOLD}[SUCCESS]{Colors.END} {message}")
-
-def print_error(message: str) -> None:
-    """Print an error message"""
-    print(f"{Colors.RED}{Colors.BOLD}[ERROR]{Colors.END} {message}")
-
-def print_warning(message: str) -> None:
-    """Print a warning message"""
-    print(f"{Colors.YELLOW}{Colors.BOLD}[WARNING]{Colors.END} {message}")
+# Configuration and SSH settings shared with the deployment itself; ssh_command
+# multiplexes every probe over one ControlMaster connection (not on Windows)
+from deploy_droplet import DROPLET_IP, SSH_KEY_PATH, ssh_command
+from docker_ops import Colors, print_error, print_status, print_success, print_warning
 
 def test_ssh_connection() -> bool:
     """Test SSH connection to the droplet"""
@@ -57,10 +32,9 @@ def test_ssh_connection() -> bool:
     
     # Test SSH connection
     try:
-        result = subprocess.run([
-            "ssh", "-i", ssh_key_path, f"{DROPLET_USER}@{DROPLET_IP}",
+        result = subprocess.run(ssh_command(
             "echo 'SSH connection successful' && whoami && pwd"
-        ], capture_output=True, text=True, timeout=30)
+        ), capture_output=True, text=True, timeout=30)
         
         if result.returncode == 0:
             print_success("SSH connection successful!")
@@ -81,13 +55,10 @@ def test_docker_on_droplet() -> bool:
     """Test if Docker is available on the droplet"""
     print_status("Testing Docker availability on droplet...")
     
-    ssh_key_path = os.path.expanduser(SSH_KEY_PATH)
-    
     try:
-        result = subprocess.run([
-            "ssh", "-i", ssh_key_path, f"{DROPLET_USER}@{DROPLET_IP}",
+        result = subprocess.run(ssh_command(
             "docker --version"
-        ], capture_output=True, text=True, timeout=30)
+        ), capture_output=True, text=True, timeout=30)
         
         if result.returncode == 0:
             print_success(f"Docker is available: {result.stdout.strip()}")
@@ -104,13 +75,10 @@ def test_docker_hub_access() -> bool:
     """Test if droplet can access Docker Hub"""
     print_status("Testing Docker Hub access from droplet...")
     
-    ssh_key_path = os.path.expanduser(SSH_KEY_PATH)
-    
     try:
-        result = subprocess.run([
-            "ssh", "-i", ssh_key_path, f"{DROPLET_USER}@{DROPLET_IP}",
+        result = subprocess.run(ssh_command(
             "docker pull hello-world"
-        ], capture_output=True, text=True, timeout=60)
+        ), capture_output=True, text=True, timeout=60)
         
         if result.returncode == 0:
             print_success("Docker Hub access successful!")
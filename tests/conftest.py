@@ -0,0 +1,93 @@
+import os
+from pathlib import Path
+
+import pytest
+
+# Entering the app lifespan must not start a background fetch of the live
+# ABC feeds; set before app.config reads the environment
+os.environ.setdefault("PREFETCH_FEEDS_ON_STARTUP", "false")
+
+# Hub models the slow suites load
+HF_TEST_MODELS = (
+    "t5-small",
+    "bhadresh-savani/distilbert-base-uncased-emotion",
+    "distilbert/distilbert-base-cased-distilled-squad",
+)
+
+
+def _hf_models_cached() -> bool:
+    """Whether every test model is already in the local Hugging Face cache."""
+    home = Path(os.environ.get("HF_HOME") or Path.home() / ".cache" / "huggingface")
+    hub = Path(os.environ.get("HF_HUB_CACHE") or home / "hub")
+    return all((hub / f"models--{model.replace('/', '--')}").is_dir() for model in HF_TEST_MODELS)
+
+
+# Once the models are cached, load them without the hub's per-file
+# revision checks; the first run (or a CI run with an empty cache) still
+# downloads them. Point HF_HOME at a restored directory to reuse it in CI.
+if _hf_models_cached():
+    os.environ.setdefault("HF_HUB_OFFLINE", "1")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="also run tests marked slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip ``slow`` (transformer model) tests unless --runslow is given."""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --runslow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+# Strategies are built once per session and shared by the test classes.
+# Imports stay inside the fixtures so suites that don't need a model
+# (news feed, integration) don't import torch or spaCy at collection time.
+
+@pytest.fixture(scope="session")
+def sentiment_strategy():
+    from app.models.sentiment import SentimentStrategy
+    return SentimentStrategy()
+
+
+@pytest.fixture(scope="session")
+def summarization_strategy():
+    from app.models.summarize import SummarizationStrategy
+    return SummarizationStrategy()
+
+
+@pytest.fixture(scope="session")
+def emotion_strategy():
+    from app.models.emotion import EmotionStrategy
+    return EmotionStrategy()
+
+
+@pytest.fixture(scope="session")
+def qa_strategy():
+    from app.models.qa import QAStrategy
+    return QAStrategy()
+
+
+@pytest.fixture(scope="session")
+def ner_strategy():
+    from app.models.ner import NERStrategy
+    return NERStrategy()
+
+
+@pytest.fixture(scope="module")
+def client():
+    """One TestClient per module, inside the app lifespan.
+
+    Startup handlers (shared HTTP client, preloads) run once per module
+    instead of being skipped by a bare ``TestClient(app)`` per test.
+    """
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    with TestClient(app) as c:
+        yield c
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.services.batcher import DynamicBatcher
+
+
+class FakeStrategy:
+    """Records batch sizes; fails on inputs containing 'bad'"""
+
+    def __init__(self, fail_batch: bool = False, drop_last: bool = False):
+        self.batch_sizes = []
+        self.fail_batch = fail_batch
+        self.drop_last = drop_last
+
+    def analyze(self, text: str, **kwargs):
+        if "bad" in text:
+            raise ValueError(f"cannot analyze {text}")
+        return text.upper()
+
+    def analyze_batch(self, texts, **kwargs):
+        self.batch_sizes.append(len(texts))
+        if self.fail_batch:
+            raise ValueError("batch failed")
+        results = [text.upper() for text in texts]
+        return results[:-1] if self.drop_last else results
+
+
+@pytest.mark.unit
+class TestDynamicBatcher:
+    """Test suite for DynamicBatcher"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.strategy = FakeStrategy()
+
+    def _run(self, monkeypatch, batcher, texts):
+        monkeypatch.setattr("app.services.batcher.STRATEGIES", {"ner": self.strategy})
+
+        async def submit_all():
+            try:
+                calls = (batcher.submit(text) for text in texts)
+                return await asyncio.wait_for(
+                    asyncio.gather(*calls, return_exceptions=True), timeout=5
+                )
+            finally:
+                await batcher.stop()
+
+        return asyncio.run(submit_all())
+
+    def test_flushes_when_batch_is_full(self, monkeypatch):
+        """A full batch runs without waiting for the deadline"""
+        batcher = DynamicBatcher("ner", max_batch=4, max_wait_ms=60_000)
+        results = self._run(monkeypatch, batcher, ["a", "b", "c", "d"])
+        assert results == ["A", "B", "C", "D"]
+        assert self.strategy.batch_sizes == [4]
+
+    def test_flushes_at_deadline(self, monkeypatch):
+        """A partial batch runs once max_wait_ms has passed"""
+        batcher = DynamicBatcher("ner", max_batch=16, max_wait_ms=20)
+        results = self._run(monkeypatch, batcher, ["a", "b", "c"])
+        assert results == ["A", "B", "C"]
+        assert self.strategy.batch_sizes == [3]
+
+    def test_splits_overflow_into_next_batch(self, monkeypatch):
+        """Inputs beyond max_batch go into a following batch"""
+        batcher = DynamicBatcher("ner", max_batch=2, max_wait_ms=20)
+        results = self._run(monkeypatch, batcher, ["a", "b", "c"])
+        assert results == ["A", "B", "C"]
+        assert self.strategy.batch_sizes == [2, 1]
+
+    def test_batch_failure_falls_back_to_single_items(self, monkeypatch):
+        """Only the failing input gets an error when a batch call raises"""
+        self.strategy = FakeStrategy(fail_batch=True)
+        batcher = DynamicBatcher("ner", max_batch=4, max_wait_ms=20)
+        results = self._run(monkeypatch, batcher, ["a", "bad", "c"])
+        assert results[0] == "A"
+        assert isinstance(results[1], ValueError)
+        assert results[2] == "C"
+
+    def test_result_count_mismatch_fails_requests(self, monkeypatch):
+        """A short result list fails every request instead of hanging"""
+        self.strategy = FakeStrategy(drop_last=True)
+        batcher = DynamicBatcher("ner", max_batch=4, max_wait_ms=20)
+        results = self._run(monkeypatch, batcher, ["a", "b"])
+        assert all(isinstance(r, RuntimeError) for r in results)
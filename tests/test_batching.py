@@ -0,0 +1,33 @@
+import pytest
+from app.models.batching import run_length_sorted
+
+
+@pytest.mark.unit
+class TestRunLengthSorted:
+    """Test suite for run_length_sorted"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.seen = []
+
+    def fake_pipe(self, inputs, **kwargs):
+        self.seen.append(list(inputs))
+        return [{"text": text, **kwargs} for text in inputs]
+
+    def test_runs_shortest_first(self):
+        """Test that the pipeline sees inputs sorted by length"""
+        texts = ["ccc", "a", "bb"]
+        run_length_sorted(self.fake_pipe, texts, [3, 1, 2])
+        assert self.seen == [["a", "bb", "ccc"]]
+
+    def test_results_in_input_order(self):
+        """Test that results are returned in the caller's order"""
+        texts = ["ccc", "a", "bb", "dddd"]
+        results = run_length_sorted(self.fake_pipe, texts, [3, 1, 2, 4], flag=True)
+        assert [r["text"] for r in results] == texts
+        assert all(r["flag"] for r in results)
+
+    def test_single_dict_result_is_wrapped(self):
+        """Test that a pipeline unwrapping a one-item batch still yields a list"""
+        results = run_length_sorted(lambda inputs: {"answer": "x"}, [{"q": 1}], [5])
+        assert results == [{"answer": "x"}]
@@ -1,14 +1,14 @@
 import pytest
-from app.models.emotion import EmotionStrategy
 
 @pytest.mark.unit
 @pytest.mark.slow
 class TestEmotionStrategy:
     """Test suite for EmotionStrategy"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.strategy = EmotionStrategy()
+    @pytest.fixture(autouse=True)
+    def _attach(self, emotion_strategy):
+        """Use the session-wide strategy"""
+        self.strategy = emotion_strategy
     
     def test_joy_emotion(self):
         """Test detection of joy emotion"""
@@ -96,6 +96,7 @@ class TestEmotionStrategy:
             "This is neutral."
         ]
         
-        for text in test_texts:
-            result = self.strategy.analyze(text)
+        results = self.strategy.analyze_batch(test_texts)
+        assert len(results) == len(test_texts)
+        for result in results:
             assert result["label"] in valid_emotions
\ No newline at end of file
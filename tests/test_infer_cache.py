@@ -0,0 +1,29 @@
+import pytest
+from app.services import infer_cache
+
+
+@pytest.mark.unit
+class TestInferCache:
+    """Test suite for the analysis result cache"""
+
+    def setup_method(self):
+        """Start every test with an empty cache"""
+        infer_cache.clear()
+
+    def test_round_trip(self):
+        """Test that a stored result is returned for the same input"""
+        key = infer_cache.cache_key("sentiment", "Great news!")
+        assert infer_cache.get_result(key) is None
+        infer_cache.set_result(key, {"sentiment": "positive"})
+        assert infer_cache.get_result(infer_cache.cache_key("sentiment", "Great news!")) == {"sentiment": "positive"}
+
+    def test_keys_differ_by_task_and_text(self):
+        """Test that task and text are both part of the key"""
+        base = infer_cache.cache_key("sentiment", "text")
+        assert base != infer_cache.cache_key("emotion", "text")
+        assert base != infer_cache.cache_key("sentiment", "other text")
+
+    def test_context_only_matters_for_qa(self):
+        """Test that context changes the key for QA only"""
+        assert infer_cache.cache_key("ner", "t", "a") == infer_cache.cache_key("ner", "t", "b")
+        assert infer_cache.cache_key("qa", "t", "a") != infer_cache.cache_key("qa", "t", "b")
@@ -1,13 +1,13 @@
 import pytest
-from app.models.ner import NERStrategy
 
 @pytest.mark.unit
 class TestNERStrategy:
     """Test suite for NERStrategy"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.strategy = NERStrategy()
+    @pytest.fixture(autouse=True)
+    def _attach(self, ner_strategy):
+        """Use the session-wide strategy"""
+        self.strategy = ner_strategy
     
     def test_person_entity(self):
         """Test extraction of person entities"""
@@ -84,4 +84,8 @@ class TestNERStrategy:
         
         # Check that we have different entity types
         entity_labels = [ent["label"] for ent in result]
-        assert len(set(entity_labels)) >= 1  # At least one unique label 
\ No newline at end of file
+        assert len(set(entity_labels)) >= 1  # At least one unique label 
+    def test_analyze_batch_matches_analyze(self):
+        """Test that nlp.pipe batch results equal per-item results"""
+        texts = ["John Smith works at Microsoft.", "Apple Inc. is headquartered in Cupertino.", ""]
+        assert self.strategy.analyze_batch(texts) == [self.strategy.analyze(t) for t in texts]
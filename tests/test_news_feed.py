@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+import asyncio
 import pytest
 import types
+import httpx
 from unittest.mock import Mock, patch
-from app.services.news_feed import fetch_abc_feed, NewsArticle
+from app.services import news_feed
+from app.services.news_feed import afetch_abc_feed, fetch_abc_feed, NewsArticle
 
 
-class DummyEntry:
-    """Mock RSS feed entry for testing"""
+RSS_XML = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Test</title>
+<item><title>Async Article</title><link>https://example.org/async</link>
+<pubDate>Mon, 01 Jan 2025 00:00:00 GMT</pubDate><description>Summary</description></item>
+</channel></rss>"""
+
+
+class DummyEntry(dict):
+    """Mock RSS feed entry for testing; feedparser entries are dicts"""
     def __init__(self, title: str, link: str, published: str, summary: str):
-        self.title = title
-        self.link = link
-        self.published = published
-        self.summary = summary
+        super().__init__(title=title, link=link, published=published, summary=summary)
 
 
 @pytest.mark.unit
@@ -21,6 +28,8 @@ class TestNewsFeed:
     
     def setup_method(self):
         """Set up test fixtures"""
+        # Every test parses its own fake feed, so none may see a cached one
+        news_feed._feed_cache.clear()
         self.dummy_entries = [
             DummyEntry(
                 "Test Article 1", 
@@ -185,3 +194,124 @@ class TestNewsFeed:
         assert articles[1].title == "No Published Date"
         assert articles[1].published == ""
         assert articles[1].summary == "Summary here"
+
+
+@pytest.mark.unit
+class TestAsyncNewsFeed:
+    """Test suite for afetch_abc_feed over the pooled httpx client"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.requests = 0
+
+    def _fetch(self, monkeypatch, handler, concurrency=1, fresh=False, reset=True, full_text=False):
+        if reset:
+            news_feed._feed_cache.clear()
+
+        def counting_handler(request: httpx.Request) -> httpx.Response:
+            self.requests += 1
+            return handler(request)
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(counting_handler))
+            monkeypatch.setattr(news_feed, "_http_client", client)
+            try:
+                calls = (
+                    afetch_abc_feed("top_stories", full_text=full_text, fresh=fresh)
+                    for _ in range(concurrency)
+                )
+                return await asyncio.gather(*calls, return_exceptions=True)
+            finally:
+                await client.aclose()
+
+        return asyncio.run(run())
+
+    def test_concurrent_misses_share_one_request(self, monkeypatch):
+        """N concurrent cache misses cause exactly one upstream fetch"""
+        results = self._fetch(monkeypatch, lambda r: httpx.Response(200, content=RSS_XML), 10)
+        assert self.requests == 1
+        assert all(len(r) == 1 and r[0].title == "Async Article" for r in results)
+        assert results[0] is results[-1]
+        assert news_feed._inflight == {}
+
+    def test_result_is_cached(self, monkeypatch):
+        """A successful fetch is served from the feed cache afterwards"""
+        self._fetch(monkeypatch, lambda r: httpx.Response(200, content=RSS_XML))
+        assert news_feed._feed_cache.get(("top_stories", False)) is not None
+
+    def test_not_modified_reuses_cached_copy(self, monkeypatch):
+        """An expired feed is revalidated with its ETag and a 304 skips parsing"""
+        seen = []
+
+        def conditional(request):
+            seen.append(request.headers.get("if-none-match"))
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=RSS_XML, headers={"etag": '"v1"'})
+
+        first = self._fetch(monkeypatch, conditional)[0]
+        second = self._fetch(monkeypatch, conditional, fresh=True, reset=False)[0]
+        assert seen == [None, '"v1"']
+        assert second is first
+        assert news_feed._feed_cache.get(("top_stories", False)) is first
+
+    def test_fresh_bypasses_cache(self, monkeypatch):
+        """fresh=True refetches even when the feed is cached"""
+        def ok(request):  # noqa: ARG001
+            return httpx.Response(200, content=RSS_XML)
+
+        self._fetch(monkeypatch, ok)
+        self._fetch(monkeypatch, ok, reset=False)
+        assert self.requests == 1
+        self._fetch(monkeypatch, ok, fresh=True, reset=False)
+        assert self.requests == 2
+
+    def test_full_text_downloaded_and_parsed(self, monkeypatch):
+        """Article pages are fetched over the client and parsed locally"""
+        monkeypatch.setattr(news_feed, "_parse_article_html", lambda link, html: f"{link}: {html}")
+
+        def handler(request):
+            if request.url.host == "example.org":
+                return httpx.Response(200, text="<html>page</html>")
+            return httpx.Response(200, content=RSS_XML)
+
+        (articles,) = self._fetch(monkeypatch, handler, full_text=True)
+        assert self.requests == 2
+        assert articles[0].full_text == "https://example.org/async: <html>page</html>"
+        assert articles[0].to_dict()["full_text"] == articles[0].full_text
+
+    def test_full_text_failure_leaves_none(self, monkeypatch):
+        """A failed article download leaves full_text as None"""
+        def handler(request):
+            if request.url.host == "example.org":
+                return httpx.Response(404)
+            return httpx.Response(200, content=RSS_XML)
+
+        (articles,) = self._fetch(monkeypatch, handler, full_text=True)
+        assert articles[0].full_text is None
+        assert articles[0].title == "Async Article"
+
+    def test_http_error_returns_empty_and_is_not_cached(self, monkeypatch):
+        """An HTTP error yields [] and leaves the cache empty"""
+        results = self._fetch(monkeypatch, lambda r: httpx.Response(503))
+        assert results == [[]]
+        assert news_feed._feed_cache.get(("top_stories", False)) is None
+        assert news_feed._inflight == {}
+
+    def test_http_error_briefly_remembered(self, monkeypatch):
+        """A failed feed is not refetched until the failure TTL expires"""
+        self._fetch(monkeypatch, lambda r: httpx.Response(503))
+        results = self._fetch(monkeypatch, lambda r: httpx.Response(503), reset=False)
+        assert results == [[]]
+        assert self.requests == 1
+        self._fetch(monkeypatch, lambda r: httpx.Response(200, content=RSS_XML), fresh=True, reset=False)
+        assert self.requests == 2
+        assert not news_feed._feed_cache.failed(("top_stories", False))
+
+    def test_inflight_cleared_after_failure(self, monkeypatch):
+        """A failed parse propagates to every waiter and clears the in-flight map"""
+        monkeypatch.setattr(news_feed, "_abuild_articles", Mock(side_effect=ValueError("bad feed")))
+        results = self._fetch(monkeypatch, lambda r: httpx.Response(200, content=RSS_XML), 3)
+        assert self.requests == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert news_feed._inflight == {}
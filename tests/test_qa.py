@@ -1,14 +1,14 @@
 import pytest
-from app.models.qa import QAStrategy
 
 @pytest.mark.unit
 @pytest.mark.slow
 class TestQAStrategy:
     """Test suite for QAStrategy"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.strategy = QAStrategy()
+    @pytest.fixture(autouse=True)
+    def _attach(self, qa_strategy):
+        """Use the session-wide strategy"""
+        self.strategy = qa_strategy
     
     def test_basic_question_answering(self):
         """Test basic question answering functionality"""
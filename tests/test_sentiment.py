@@ -1,13 +1,15 @@
 import pytest
-from app.models.sentiment import SentimentStrategy
+
+SENTIMENT_KEYS = frozenset({"sentiment", "polarity", "subjectivity"})
 
 @pytest.mark.unit
 class TestSentimentStrategy:
     """Test suite for SentimentStrategy"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.strategy = SentimentStrategy()
+    @pytest.fixture(autouse=True)
+    def _attach(self, sentiment_strategy):
+        """Use the session-wide strategy"""
+        self.strategy = sentiment_strategy
     
     @pytest.mark.parametrize("text,expected_sentiment", [
         ("I love this amazing product!", "positive"),
@@ -54,6 +56,9 @@ class TestSentimentStrategy:
         """Test that result has expected structure"""
         text = "This is a test sentence."
         result = self.strategy.analyze(text)
-        
-        expected_keys = {"sentiment", "polarity", "subjectivity"}
-        assert set(result.keys()) == expected_keys 
\ No newline at end of file
+        assert result.keys() == SENTIMENT_KEYS
+    
+    def test_analyze_batch_matches_analyze(self):
+        """Test that batch results equal per-item results"""
+        texts = ["I love this amazing product!", "This is awful and disgusting!", "This is a book."]
+        assert self.strategy.analyze_batch(texts) == [self.strategy.analyze(t) for t in texts]